@@ -5,30 +5,57 @@ and caches loaded images.
 """
 import os
 import sys
+from functools import lru_cache
+from typing import Optional
 import pygame
 
-_image_cache = {}
+# Upper bound on cached surfaces so long sessions can't grow the cache forever
+IMAGE_CACHE_SIZE = 64
 
 def resource_path(relative_path: str) -> str:
     """Return absolute path to resource, works for dev and PyInstaller bundles.
 
+    Absolute paths are returned unchanged.
     Example: resource_path('assets/lander.png')
     """
+    if os.path.isabs(relative_path):
+        return relative_path
     try:
         base_path = sys._MEIPASS  # type: ignore[attr-defined]
     except Exception:
         base_path = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base_path, relative_path)
 
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
+def _load_cached(relative_path: str, mtime_ns: Optional[int]) -> pygame.Surface:
+    """Decode an image from disk and convert it for fast blitting.
+
+    mtime_ns is only part of the cache key so a changed file gets reloaded.
+    """
+    return pygame.image.load(resource_path(relative_path)).convert_alpha()
+
+def _asset_mtime(relative_path: str) -> Optional[int]:
+    """Return the file's mtime in ns, or None when it can't change or be read.
+
+    Files inside a PyInstaller bundle are immutable, so skip the stat there.
+    """
+    if getattr(sys, '_MEIPASS', None):
+        return None
+    try:
+        return os.stat(resource_path(relative_path)).st_mtime_ns
+    except OSError:
+        return None
+
 def load_image(relative_path: str) -> pygame.Surface:
     """Load and cache an image by relative path.
 
+    The cache is keyed on the file's modification time, so assets replaced
+    during a session are picked up on the next call.
     Raises the underlying pygame error if the file cannot be loaded.
     """
-    if relative_path in _image_cache:
-        return _image_cache[relative_path]
+    # Normalise so aliases like './assets/x.png' share one cache entry
+    key = os.path.normcase(os.path.normpath(relative_path))
+    return _load_cached(key, _asset_mtime(key))
 
-    full = resource_path(relative_path)
-    surf = pygame.image.load(full).convert_alpha()
-    _image_cache[relative_path] = surf
-    return surf
+# Allow callers (and tests) to drop cached surfaces
+load_image.cache_clear = _load_cached.cache_clear  # type: ignore[attr-defined]
@@ -5,6 +5,10 @@ Run with: python build.py
 This script uses PyInstaller to create either a debug version (with console)
 or a release version (without console) of the game. Both versions will be
 created by default when running the script.
+
+By default each version is built as a folder (dist/<name>/<name>.exe) which
+starts almost instantly; pass --onefile for a single self-extracting exe that
+has to unpack itself to a temp dir on every launch.
 """
 import PyInstaller.__main__
 import os
@@ -19,21 +23,31 @@ PGZERO_PATH = os.path.dirname(pgzero.__file__)
 ICON_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'assets', 'icon.ico'))
 ASSETS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'assets'))
 
-def build_game(debug=False):
+def clean():
+    """Remove previous PyInstaller output directories."""
+    for dir_name in ['build', 'dist']:
+        shutil.rmtree(dir_name, ignore_errors=True)
+
+def build_game(debug=False, onefile=False):
     """Build a version of the game executable.
     
     Args:
         debug: If True, builds with console window and debug name
+        onefile: If True, builds a single self-extracting exe instead of a folder
     """
     # Set name and console mode based on debug flag
     name = 'LunarLander-debug' if debug else 'LunarLander'
     windowed = not debug  # Show console in debug mode
     
     # PyInstaller configuration
+    # Assets ship as loose files rather than a zip: folder builds read them
+    # straight from _internal/assets (nothing is extracted at launch), there
+    # are only a handful of them, and the audio loaders need real file paths.
     cmd = [
         'main.py',                          # Main game script
         f'--name={name}',                   # Executable name
-        '--onefile',                        # Create single executable
+        '--onefile' if onefile else '--onedir',  # Folder build avoids per-launch unpacking
+        '--noupx',                          # UPX-compressed DLLs are slower to load
         f'--add-data={PGZERO_PATH};pgzero', # Include pgzero data
         f'--add-data={ASSETS_PATH};assets',  # Include game assets
         '--hidden-import=pgzero.builtins',   # Required imports
@@ -43,6 +57,10 @@ def build_game(debug=False):
         f'--icon={ICON_PATH}'               # Custom icon
     ]
     
+    # Keep the exe folder tidy: dependencies go in _internal/
+    if not onefile:
+        cmd.append('--contents-directory=_internal')
+
     # Add windowed flag for release builds
     if windowed:
         cmd.append('--windowed')
@@ -55,17 +73,17 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Build the Lunar Lander executables')
     parser.add_argument('--bundle-vcruntime', action='store_true',
                         help='After building, copy VC runtime DLLs into each dist/ folder')
+    parser.add_argument('--onefile', action='store_true',
+                        help='Build single-file executables (slower startup) instead of folders')
     args = parser.parse_args()
 
-    # Clean old builds
-    for dir_name in ['build', 'dist']:
-        if os.path.exists(dir_name):
-            shutil.rmtree(dir_name)
+    # Clean old builds once, before both variants are built
+    clean()
 
     print("Building debug version...")
-    build_game(debug=True)
+    build_game(debug=True, onefile=args.onefile)
     print("\nBuilding release version...")
-    build_game(debug=False)
+    build_game(debug=False, onefile=args.onefile)
     print("\nBuild complete! Executables are in the 'dist' folder.")
 
     # Optionally bundle VC runtime DLLs into dist/
@@ -74,9 +92,13 @@ if __name__ == '__main__':
         bundler = os.path.join(os.path.dirname(__file__), 'tools', 'bundle_vcruntime.py')
         if os.path.exists(bundler):
             print('\nBundling VC runtime DLLs into dist/...')
-            try:
-                subprocess.check_call([sys.executable, bundler, '--dist', 'dist'])
-            except subprocess.CalledProcessError:
-                print('Bundling helper failed (non-zero exit)')
+            # Folder builds keep each exe in its own dist/<name>/ directory
+            targets = ['dist'] if args.onefile else \
+                [os.path.join('dist', n) for n in ('LunarLander-debug', 'LunarLander')]
+            for target in targets:
+                try:
+                    subprocess.check_call([sys.executable, bundler, '--dist', target])
+                except subprocess.CalledProcessError:
+                    print('Bundling helper failed (non-zero exit)')
         else:
             print(f'Bundling helper not found: {bundler}')
\ No newline at end of file
@@ -3,29 +3,51 @@ Create a simple icon for the Lunar Lander game.
 This script generates a basic geometric icon representing a lunar lander.
 """
 from PIL import Image, ImageDraw
+import hashlib
 import os
+import sys
 
-def draw_lander(image, draw, center_x, center_y, with_background=False):
-    """Draw the lander on the given image."""
-    if with_background:
-        # Draw stars
-        for i in range(20):
-            x = (i * 37) % image.width
-            y = (i * 53) % (image.height - 100)
-            draw.point((x, y), fill=(255, 255, 255))
-        
-        # Draw moon surface
-        surface_y = image.height - 40
-        draw.rectangle([(0, surface_y), (image.width, image.height)], 
-                      fill=(80, 80, 80))
-        
-        # Draw landing pad
-        pad_width = 60
-        pad_x = image.width // 2 - pad_width // 2
-        pad_y = surface_y - 10
-        draw.rectangle([(pad_x, pad_y), (pad_x + pad_width, pad_y + 10)], 
-                      fill=(255, 255, 0), outline=(0, 0, 0))
+ICON_PATH = os.path.join('assets', 'icon.ico')
+SPRITE_PATH = os.path.join('assets', 'lander.png')
+# Records which version of this script produced the files above. Kept out of
+# assets/ so build.py doesn't bundle it into the executable; git-ignored.
+STAMP_PATH = '.icon.stamp'
 
+def source_hash():
+    """Hash this script's source; drawing is deterministic so it identifies the output."""
+    with open(__file__, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+def is_up_to_date(src_hash):
+    """Return True if the icon and sprite were generated from src_hash."""
+    if not (os.path.exists(ICON_PATH) and os.path.exists(SPRITE_PATH)):
+        return False
+    try:
+        with open(STAMP_PATH, 'r', encoding='utf-8') as f:
+            return f.read().strip() == src_hash
+    except OSError:
+        return False
+
+def draw_background(image, draw):
+    """Draw the star field, moon surface and landing pad on the given image."""
+    # Draw stars (one point() call for the whole batch)
+    stars = [((i * 37) % image.width, (i * 53) % (image.height - 100)) for i in range(20)]
+    draw.point(stars, fill=(255, 255, 255))
+    
+    # Draw moon surface
+    surface_y = image.height - 40
+    draw.rectangle([(0, surface_y), (image.width, image.height)], 
+                  fill=(80, 80, 80))
+    
+    # Draw landing pad
+    pad_width = 60
+    pad_x = image.width // 2 - pad_width // 2
+    pad_y = surface_y - 10
+    draw.rectangle([(pad_x, pad_y), (pad_x + pad_width, pad_y + 10)], 
+                  fill=(255, 255, 0), outline=(0, 0, 0))
+
+def draw_lander(draw, center_x, center_y):
+    """Draw the lander centred on (center_x, center_y)."""
     # Main body (capsule)
     capsule_points = [
         (center_x, center_y - 40),       # Top
@@ -52,50 +74,54 @@ def draw_lander(image, draw, center_x, center_y, with_background=False):
                (center_x + 33, center_y + 45)],
               fill=(192, 192, 192), width=3)
 
-def create_icon():
-    # Create window icon with background
+def create_icon(force=False):
+    src_hash = source_hash()
+    if not force and is_up_to_date(src_hash):
+        print("Icon and sprite are up to date, skipping")
+        return
+
+    # Draw the lander once on a transparent master shared by icon and sprite
     size = 256
+    master = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw_lander(ImageDraw.Draw(master), size//2, size//2)
+
+    # Window icon: background scene with the lander composited on top.
     # Use RGB for ICO file
     icon_image = Image.new('RGB', (size, size), (10, 10, 30))
-    icon_draw = ImageDraw.Draw(icon_image)
-    
-    # Draw lander with background for window icon
-    draw_lander(icon_image, icon_draw, size//2, size//2, with_background=True)
-    
-    # Create sprite without background
+    draw_background(icon_image, ImageDraw.Draw(icon_image))
+    icon_image.paste(master, (0, 0), master)
+
+    # Sprite: the lander fits in the central 128x128 of the master
     sprite_size = 128
-    sprite_image = Image.new('RGBA', (sprite_size, sprite_size), (0, 0, 0, 0))
-    sprite_draw = ImageDraw.Draw(sprite_image)
-    
-    # Draw just the lander for the sprite
-    draw_lander(sprite_image, sprite_draw, sprite_size//2, sprite_size//2, with_background=False)
-    
-    # Ensure the assets directory exists
-    if not os.path.exists('assets'):
-        os.makedirs('assets')
+    offset = (size - sprite_size) // 2
+    sprite_image = master.crop((offset, offset, offset + sprite_size, offset + sprite_size))
     
     # Ensure the assets directory exists
     if not os.path.exists('assets'):
         os.makedirs('assets')
 
-    # Save window icon with multiple sizes
+    # Save window icon with multiple sizes, each resized from the same master
     icon_sizes = [(256, 256), (128, 128), (64, 64), (32, 32), (16, 16)]
     icon_images = []
     for s in icon_sizes:
-        # Resize and convert to RGB for each size
-        icon_images.append(icon_image.resize(s, Image.Resampling.LANCZOS).convert('RGB'))
+        # LANCZOS only pays off for the large entries; small ones look the same with BILINEAR
+        algo = Image.Resampling.LANCZOS if s[0] >= 64 else Image.Resampling.BILINEAR
+        icon_images.append(icon_image.resize(s, algo).convert('RGB'))
 
-    # Save the icon with multiple sizes
-    icon_path = os.path.join('assets', 'icon.ico')
-    icon_images[0].save(icon_path, format='ICO', sizes=icon_sizes)
+    # Save the icon with multiple sizes (pass the resized frames so PIL uses them)
+    icon_path = ICON_PATH
+    icon_images[0].save(icon_path, format='ICO', sizes=icon_sizes, append_images=icon_images[1:])
     print(f"Icon created at: {icon_path}")
     
     # Save the sprite for the game
     game_sprite_size = (64, 64)  # Size for the game sprite
     game_sprite = sprite_image.resize(game_sprite_size, Image.Resampling.LANCZOS)
-    game_sprite_path = os.path.join('assets', 'lander.png')
+    game_sprite_path = SPRITE_PATH
     game_sprite.save(game_sprite_path, format='PNG')
     print(f"Game sprite created at: {game_sprite_path}")
 
+    with open(STAMP_PATH, 'w', encoding='utf-8') as f:
+        f.write(src_hash)
+
 if __name__ == '__main__':
-    create_icon()
\ No newline at end of file
+    create_icon(force='--force' in sys.argv[1:])
\ No newline at end of file
@@ -7,14 +7,36 @@ from typing import Optional, Tuple
 import pygame
 
 
+# Character -> pygame keycode, built once so polling doesn't getattr per frame
+_CHAR_TO_KEYCODE = {c: getattr(pygame, f'K_{c}') for c in 'abcdefghijklmnopqrstuvwxyz0123456789'}
+_CHAR_TO_KEYCODE.update({' ': pygame.K_SPACE, '-': pygame.K_MINUS, '_': pygame.K_MINUS})
+_CHAR_TO_KEYCODE.update({'return': pygame.K_RETURN, 'escape': pygame.K_ESCAPE, 'backspace': pygame.K_BACKSPACE})
+
+# Case-folding tables indexed [shift_on][caps_on]: letters go upper when
+# exactly one of shift/caps is active, shift also turns '-' into '_'
+_LOWER = 'abcdefghijklmnopqrstuvwxyz'
+_UPPER = _LOWER.upper()
+_CASE_TABLES = (
+    (str.maketrans({}), str.maketrans(_LOWER, _UPPER)),
+    (str.maketrans(_LOWER + '-', _UPPER + '_'), str.maketrans('-', '_')),
+)
+
+
 class TextInputHandler:
+    # Modifier masks bound once instead of looked up on pygame every frame
+    _SHIFT_MASK = pygame.KMOD_LSHIFT | pygame.KMOD_RSHIFT | pygame.KMOD_SHIFT
+    _CAPS_MASK = pygame.KMOD_CAPS
+    # Keys polled for name characters. '_' has no key of its own (it is
+    # shift + '-' via the case tables), so it isn't polled separately.
+    _ALLOWED_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789 -')
+
     def __init__(self, repeat_delay: int = 500, repeat_interval: int = 50, max_length: int = 15):
         self.repeat_delay = repeat_delay
         self.repeat_interval = repeat_interval
         self.max_length = max_length
 
         self.entering = False
-        self.name = ""
+        self._name_chars = []
         self.name_time = 0
         self.show_cursor = True
 
@@ -23,6 +45,17 @@ class TextInputHandler:
         self.key_last_time = {}
         self.key_next_repeat = {}
 
+        # pygame.key.get_pressed() snapshot, only set while update() runs
+        self._pressed_snapshot = None
+
+    @property
+    def name(self) -> str:
+        return ''.join(self._name_chars)
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name_chars = list(value)
+
     def start(self, initial_name: str = "", consume_keys: Optional[set] = None) -> None:
         self.entering = True
         self.name = initial_name or ""
@@ -46,31 +79,46 @@ class TextInputHandler:
         return self.name + ('_' if self.show_cursor else ' ')
 
     def _key_pressed(self, keyboard, k: str) -> bool:
-        # Safe getter for pgzero keyboard plus pygame fallback
-        pressed = False
-        try:
-            pressed = bool(getattr(keyboard, k.lower(), False))
-        except Exception:
-            pressed = False
+        # pygame's key snapshot first (one index), pgzero keyboard as a fallback;
+        # pgzero resolves attribute names through a regex and an enum lookup
+        keycode = _CHAR_TO_KEYCODE.get(k)
+        if keycode is not None:
+            try:
+                kp = self._pressed_snapshot
+                if kp is None:
+                    kp = pygame.key.get_pressed()
+                if kp[keycode]:
+                    return True
+            except Exception:
+                pass
 
         try:
-            kp = pygame.key.get_pressed()
-            keycode = None
-            if len(k) == 1 and k.isalpha():
-                keycode = getattr(pygame, f'K_{k.lower()}', None)
-            elif len(k) == 1 and k.isdigit():
-                keycode = getattr(pygame, f'K_{k}', None) or getattr(pygame, f'K_KP{k}', None)
-            elif k == ' ':
-                keycode = pygame.K_SPACE
-            elif k in ('-', '_'):
-                keycode = pygame.K_MINUS
-
-            if keycode is not None and kp[keycode]:
-                pressed = True
+            return bool(getattr(keyboard, k, False))
         except Exception:
-            pass
-
-        return pressed
+            return False
+
+    def _should_repeat(self, key: str, current_time: int) -> bool:
+        """Return True when a held key is due for its next repeat."""
+        return (current_time >= self.key_next_repeat.get(key, 0) and
+                current_time - self.key_last_time.get(key, 0) >= self.repeat_interval)
+
+    def _mark_key(self, key: str, current_time: int, is_repeat: bool) -> None:
+        """Record a key action and schedule the next repeat."""
+        self.key_last_time[key] = current_time
+        self.key_next_repeat[key] = current_time + (self.repeat_interval if is_repeat else self.repeat_delay)
+
+    def _commit_char(self, ch: str, current_time: int, case_table: dict, is_repeat: bool) -> bool:
+        """Append ch (case-folded) if there is room. Returns True if inserted."""
+        if len(self._name_chars) >= self.max_length:
+            return False
+        self._name_chars.append(ch.translate(case_table))
+        self._mark_key(ch, current_time, is_repeat)
+        return True
+
+    def _delete_char(self, current_time: int, is_repeat: bool) -> None:
+        if self._name_chars:
+            self._name_chars.pop()
+        self._mark_key('BACKSPACE', current_time, is_repeat)
 
     def update(self, keyboard) -> Tuple[str, Optional[str]]:
         """Process input. Returns (status, name).
@@ -80,6 +128,28 @@ class TextInputHandler:
         if not self.entering:
             return 'idle', None
 
+        # Poll SDL once per update rather than once per candidate key
+        self._pressed_snapshot, mods = self._poll_keys()
+        try:
+            return self._process(keyboard, mods)
+        finally:
+            self._pressed_snapshot = None
+
+    @staticmethod
+    def _poll_keys():
+        """Return (pressed, mods) from pygame; (None, 0) parts if unavailable."""
+        try:
+            pressed = pygame.key.get_pressed()
+        except Exception:
+            pressed = None
+        try:
+            mods = pygame.key.get_mods()
+        except Exception:
+            mods = 0
+        return pressed, mods
+
+    def _process(self, keyboard, mods: int) -> Tuple[str, Optional[str]]:
+        """Body of update(); runs with the key snapshot in place."""
         current_time = pygame.time.get_ticks()
 
         # Blink cursor
@@ -100,71 +170,37 @@ class TextInputHandler:
             self.stop()
             return 'cancel', None
 
-        allowed_chars = 'abcdefghijklmnopqrstuvwxyz0123456789 -_'
+        shift_on = bool(mods & self._SHIFT_MASK)
+        caps_on = bool(mods & self._CAPS_MASK)
+        case_table = _CASE_TABLES[shift_on][caps_on]
 
-        mods = 0
-        try:
-            mods = pygame.key.get_mods()
-        except Exception:
-            mods = 0
-        shift_on = bool(mods & (pygame.KMOD_LSHIFT | pygame.KMOD_RSHIFT | pygame.KMOD_SHIFT))
-        caps_on = bool(mods & pygame.KMOD_CAPS)
-
-        pressed_chars = set(k for k in allowed_chars if key_pressed(k))
+        pressed_chars = {k for k in self._ALLOWED_CHARS if key_pressed(k)}
         backspace_now = key_pressed('backspace') or getattr(keyboard, 'BACKSPACE', False)
 
         # BACKSPACE handling
         if backspace_now:
             if 'BACKSPACE' not in self.prev_pressed_keys:
-                if self.name:
-                    self.name = self.name[:-1]
-                self.key_last_time['BACKSPACE'] = current_time
-                self.key_next_repeat['BACKSPACE'] = current_time + self.repeat_delay
-            else:
-                if current_time >= self.key_next_repeat.get('BACKSPACE', 0) and (
-                    current_time - self.key_last_time.get('BACKSPACE', 0) >= self.repeat_interval):
-                    if self.name:
-                        self.name = self.name[:-1]
-                    self.key_last_time['BACKSPACE'] = current_time
-                    self.key_next_repeat['BACKSPACE'] = current_time + self.repeat_interval
+                self._delete_char(current_time, is_repeat=False)
+            elif self._should_repeat('BACKSPACE', current_time):
+                self._delete_char(current_time, is_repeat=True)
 
         # Character handling
         new_presses = pressed_chars - self.prev_pressed_keys
         held = pressed_chars & self.prev_pressed_keys
 
         for ch in new_presses:
-            if len(self.name) < self.max_length:
-                actual = ch
-                if ch.isalpha():
-                    if shift_on ^ caps_on:
-                        actual = ch.upper()
-                elif ch == '-':
-                    if shift_on:
-                        actual = '_'
-                self.name += actual
-                self.key_last_time[ch] = current_time
-                self.key_next_repeat[ch] = current_time + self.repeat_delay
+            if self._commit_char(ch, current_time, case_table, is_repeat=False):
                 break
 
         if not new_presses:
             for ch in held:
-                next_time = self.key_next_repeat.get(ch, 0)
-                last_time = self.key_last_time.get(ch, 0)
-                if current_time >= next_time and (current_time - last_time) >= self.repeat_interval:
-                    if len(self.name) < self.max_length:
-                        actual = ch
-                        if ch.isalpha():
-                            if shift_on ^ caps_on:
-                                actual = ch.upper()
-                        elif ch == '-':
-                            if shift_on:
-                                actual = '_'
-                        self.name += actual
-                        self.key_last_time[ch] = current_time
-                        self.key_next_repeat[ch] = current_time + self.repeat_interval
-                        break
+                if self._should_repeat(ch, current_time) and \
+                        self._commit_char(ch, current_time, case_table, is_repeat=True):
+                    break
 
         # update prev pressed
         self.prev_pressed_keys = set(pressed_chars)
+        if backspace_now:
+            self.prev_pressed_keys.add('BACKSPACE')
 
         return 'idle', None
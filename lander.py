@@ -2,7 +2,8 @@
 WIDTH = 800
 HEIGHT = 600
 
-# Load a player image (make sure 'player.png' is in the same folder)
+# Load a player image (make sure 'player.png' is in the same folder).
+# Actor decodes the image here, at import, so the first draw doesn't hit disk.
 player = Actor('player')
 player.pos = WIDTH // 2, HEIGHT // 2
 
@@ -15,14 +16,10 @@ def draw():
     player.draw()
 
 def update():
-    if keyboard.left:
-        player.x -= speed
-    if keyboard.right:
-        player.x += speed
-    if keyboard.up:
-        player.y -= speed
-    if keyboard.down:
-        player.y += speed
+    # Booleans coerce to 0/1, so opposing keys cancel out
+    kb = keyboard
+    player.x += (kb.right - kb.left) * speed
+    player.y += (kb.down - kb.up) * speed
 
 # Required to run with `py lander.py`
 import pgzrun
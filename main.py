@@ -11,15 +11,17 @@ Controls:
 
 This is intentionally lightweight: no external assets, draws the lander as a polygon.
 """
+import functools
 import math
 import random
 import pygame
 import os
 import sys
+import threading
+import time
 import pygame.font
 # redundant: removed "from pygame.locals import QUIT, KEYDOWN, KEYUP, K_ESCAPE"
 from pgzero.keyboard import keyboard
-from datetime import datetime
 from input_handler import TextInputHandler
 
 # Import a small constants module (low-risk refactor)
@@ -44,6 +46,10 @@ globals()['keyboard'] = keyboard
 pygame.init()
 pygame.mixer.init()  # Initialize mixer for audio
 
+# Background music volume during play, and while the crash sound plays
+MUSIC_VOLUME = 0.3  # 30%
+CRASH_MUSIC_VOLUME = 0.1  # 10%
+
 def load_background_music():
     """Load and start background music if available."""
     try:
@@ -53,139 +59,92 @@ def load_background_music():
         if os.path.exists(music_path):
             pygame.mixer.music.load(music_path)
             pygame.mixer.music.play(-1)  # -1 means loop indefinitely
-            pygame.mixer.music.set_volume(0.3)  # Set volume to 30%
+            pygame.mixer.music.set_volume(MUSIC_VOLUME)
             print(f"Background music loaded: {music_path}")
         else:
             print("No background music file found (looked for background.ogg or background.mp3)")
     except Exception as e:
         print(f"Could not load background music: {e}")
 
-# Load background music
-load_background_music()
+# Sound effect volumes; each effect is loaded the first time it is played
+SOUND_VOLUMES = {
+    'crash': 0.6,    # 60%
+    'thrust': 0.4,   # 40%
+    'landing': 0.8,  # 80%
+}
+_sound_cache = {}
 
-def load_crash_sound():
-    """Load crash sound effect if available."""
-    global crash_sound
-    try:
-        # Try different formats in order of preference
-        sound_paths = [
-            resource_path(os.path.join('assets', 'crash.wav')),
-            resource_path(os.path.join('assets', 'crash.ogg')),
-            resource_path(os.path.join('assets', 'crash.mp3'))
-        ]
-        for sound_path in sound_paths:
-            if os.path.exists(sound_path):
-                crash_sound = pygame.mixer.Sound(sound_path)
-                crash_sound.set_volume(0.6)  # Set volume to 60%
-                print(f"Crash sound loaded: {sound_path}")
-                return
-        print("No crash sound file found (looked for crash.wav, crash.ogg, or crash.mp3)")
-        crash_sound = None
-    except Exception as e:
-        print(f"Could not load crash sound: {e}")
-        crash_sound = None
-
-# Load crash sound
-crash_sound = None
-thrust_sound = None
-landing_sound = None
-load_crash_sound()
-
-def load_thrust_sound():
-    """Load thrust sound effect if available."""
-    global thrust_sound
-    try:
-        # Try different formats in order of preference
-        sound_paths = [
-            resource_path(os.path.join('assets', 'thrust.wav')),
-            resource_path(os.path.join('assets', 'thrust.ogg')),
-            resource_path(os.path.join('assets', 'thrust.mp3'))
-        ]
-        for sound_path in sound_paths:
-            if os.path.exists(sound_path):
-                thrust_sound = pygame.mixer.Sound(sound_path)
-                thrust_sound.set_volume(0.4)  # Set volume to 40%
-                print(f"Thrust sound loaded: {sound_path}")
-                return
-        print("No thrust sound file found (looked for thrust.wav, thrust.ogg, or thrust.mp3)")
-        thrust_sound = None
-    except Exception as e:
-        print(f"Could not load thrust sound: {e}")
-        thrust_sound = None
-
-def load_landing_sound():
-    """Load landing success sound effect if available."""
-    global landing_sound
+def get_sound(name: str):
+    """Return the named sound effect, loading it on first use.
+    
+    Args:
+        name: Effect name; assets/<name>.wav, .ogg and .mp3 are tried in order
+        
+    Returns:
+        pygame.mixer.Sound or None if no file was found or it failed to load.
+        Either outcome is cached, so the disk is only probed once per effect.
+    """
+    if name in _sound_cache:
+        return _sound_cache[name]
+    sound = None
     try:
         # Try different formats in order of preference
-        sound_paths = [
-            resource_path(os.path.join('assets', 'landing.wav')),
-            resource_path(os.path.join('assets', 'landing.ogg')),
-            resource_path(os.path.join('assets', 'landing.mp3'))
-        ]
-        for sound_path in sound_paths:
+        for ext in ('wav', 'ogg', 'mp3'):
+            sound_path = resource_path(os.path.join('assets', f'{name}.{ext}'))
             if os.path.exists(sound_path):
-                landing_sound = pygame.mixer.Sound(sound_path)
-                landing_sound.set_volume(0.8)  # Set volume to 80%
-                print(f"Landing sound loaded: {sound_path}")
-                return
-        print("No landing sound file found (looked for landing.wav, landing.ogg, or landing.mp3)")
-        landing_sound = None
+                sound = pygame.mixer.Sound(sound_path)
+                sound.set_volume(SOUND_VOLUMES.get(name, 1.0))
+                print(f"{name.capitalize()} sound loaded: {sound_path}")
+                break
+        else:
+            print(f"No {name} sound file found (looked for {name}.wav, {name}.ogg, or {name}.mp3)")
     except Exception as e:
-        print(f"Could not load landing sound: {e}")
-        landing_sound = None
+        print(f"Could not load {name} sound: {e}")
+        sound = None
+    _sound_cache[name] = sound
+    return sound
 
-# Load thrust and landing sounds
-thrust_sound = None
-landing_sound = None
-load_thrust_sound()
-load_landing_sound()
+# Start the background music on a background thread so window setup doesn't wait on it
+sound_loader = threading.Thread(target=load_background_music, name='music-loader', daemon=True)
+sound_loader.start()
 
 pygame.font.init()
 
+@functools.lru_cache(maxsize=1)
 def get_screen_resolution() -> tuple[int, int]:
     """Get the primary screen resolution in a cross-platform way.
     
     Returns:
         tuple[int, int]: A tuple containing (width, height) of the primary screen in pixels
         
-    This function attempts different methods based on the OS:
-    - Windows: Uses GetSystemMetrics via ctypes
-    - Linux: Tries xrandr command first
-    - macOS/fallback: Uses pygame display info
+    SDL's own desktop query (pygame.display.get_desktop_sizes) is tried first
+    on every platform; it needs no window and no subprocess. If that is not
+    available it falls back to:
+    - Windows: GetSystemMetrics via ctypes
+    - Others: pygame.display.Info(), which reports the desktop mode while
+      no window has been opened yet
+    The result is cached.
     """
+    try:
+        sizes = pygame.display.get_desktop_sizes()
+        if sizes and sizes[0][0] > 0 and sizes[0][1] > 0:
+            return sizes[0]
+    except Exception:
+        pass
+
     try:
         if os.name == 'nt':  # Windows
             import ctypes
             user32 = ctypes.windll.user32
             return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
-        elif os.name == 'posix':  # Linux and macOS
-            try:
-                # Try using Xrandr on Linux
-                import subprocess
-                output = subprocess.check_output('xrandr | grep "\\*"', shell=True).decode()
-                resolution = output.split()[0]
-                width, height = map(int, resolution.split('x'))
-                return width, height
-            except Exception:
-                # Fallback for macOS or if xrandr fails
-                # Create a temporary window to get the real screen size
-                pygame.display.set_mode((1, 1))
-                info = pygame.display.Info()
-                pygame.display.quit()
-                pygame.display.init()
-                return info.current_w, info.current_h
-        else:
-            # Fallback method
-            pygame.display.set_mode((1, 1))
-            info = pygame.display.Info()
-            pygame.display.quit()
-            pygame.display.init()
+        # Called before set_mode, so no throwaway window is needed
+        info = pygame.display.Info()
+        if info.current_w > 0 and info.current_h > 0:
             return info.current_w, info.current_h
     except Exception as e:
         print(f"Warning: Could not detect screen resolution: {e}")
-        # Return a safe default resolution
-        return 1024, 768
+    # Return a safe default resolution
+    return 1024, 768
 
 # Get screen resolution
 monitor_width, monitor_height = get_screen_resolution()
@@ -206,9 +165,65 @@ else:
 
 # Create game window and center it
 os.environ['SDL_VIDEO_CENTERED'] = '1'  # Center the window
-DISPLAY = pygame.display.set_mode((WIDTH, HEIGHT))
+# Present through SDL's renderer with vsync where the driver supports it.
+# The logical size is the window size, so nothing is resampled and the
+# game still draws at native resolution.
+try:
+    DISPLAY = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+    vsync_requested = True
+except pygame.error as e:
+    print(f"Warning: vsync unavailable ({e}), using a plain window")
+    DISPLAY = pygame.display.set_mode((WIDTH, HEIGHT))
+    vsync_requested = False
+
+# Shortest flip that still counts as waiting for a refresh (240 Hz is ~4.2 ms)
+VSYNC_MIN_FLIP = 0.004
+
+
+def detect_vsync(samples: int = 6) -> bool:
+    """Return True if flip() actually waits for the display refresh.
+    
+    set_mode() succeeding with vsync=1 doesn't mean vsync is in effect (the
+    driver may ignore it), and pygame can't report it, so time a few flips.
+    
+    Args:
+        samples: Number of flips to average over
+        
+    Returns:
+        bool: True if a flip takes at least VSYNC_MIN_FLIP on average.
+    """
+    pygame.display.flip()  # The first present can include setup work
+    start = time.perf_counter()
+    for _ in range(samples):
+        pygame.display.flip()
+    return (time.perf_counter() - start) / samples >= VSYNC_MIN_FLIP
+
+
+# With vsync in effect flip() already paces the loop, and wait_for_next_frame
+# must not pace it a second time (that can halve the frame rate)
+VSYNC_ACTIVE = vsync_requested and detect_vsync()
+
+# Only queue the events main() handles; mouse motion and the like are
+# dropped by SDL instead of being drained every frame
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                          pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE])
 FONT = pygame.font.SysFont(None, int(HEIGHT * 24/600))  # Scale font size relative to screen height
 
+# Load sprites once up front (needs the display mode set for convert_alpha)
+LANDER_IMAGE_PATH = os.path.join('assets', 'lander.png')
+try:
+    # Use central asset loader (handles PyInstaller bundles; already convert_alpha'd)
+    lander_sprite = load_image(LANDER_IMAGE_PATH)
+except Exception as e:
+    print(f"Error loading lander sprite from {LANDER_IMAGE_PATH}: {e}")
+    lander_sprite = None
+
+# Simple flame sprite in display format
+flame_sprite = pygame.Surface((32, 48), pygame.SRCALPHA)
+pygame.draw.polygon(flame_sprite, (255, 120, 20), [(16, 0), (32, 48), (0, 48)], 0)
+flame_sprite = flame_sprite.convert_alpha()
+
 # Scale factor for physics (relative to original 800x600 resolution)
 SCALE_FACTOR = HEIGHT / 600.0
 
@@ -234,6 +249,19 @@ last_landing_stats = None  # To store stats of the last landing
 # Sound state
 thrust_playing = False
 
+# Star field: three parallax layers, back to front
+STAR_LAYER_COUNTS = (50, 30, 20)
+STAR_LAYER_SIZES = ((1, 2), (1.5, 2.5), (2, 3))
+STAR_PARALLAX_SPEEDS = (0.2, 0.1, 0.05)
+STAR_TINTS = (
+    (255, 255, 255),  # White
+    (255, 255, 220),  # Warm white
+    (220, 220, 255),  # Cool white
+    (255, 220, 220),  # Slight red
+    (240, 240, 255),  # Slight blue
+)
+STAR_TWINKLE_STEPS = 16  # Brightness levels between 70% and 100%
+
 # Player name state
 current_player_name = load_player_name()
 # Text input handler (name editing)
@@ -251,9 +279,8 @@ lander_size = int(18 * SCALE_FACTOR)
 
 # Frame timing (TARGET_FPS provided by constants)
 MAX_DT = 1.0 / 30  # Cap the maximum time delta to prevent physics glitches
-last_frame_time = 0
-frame_times = []  # Keep track of recent frame times for FPS display
-FPS_SAMPLE_SIZE = 30  # Number of frames to average for FPS calculation
+clock = pygame.time.Clock()  # Measures frame times and FPS
+_next_frame = None  # perf_counter() deadline of the next frame
 
 # HUD font sizes and title provided by constants
 
@@ -265,47 +292,131 @@ HUD_BOTTOM_MARGIN = int(HEIGHT * 0.02)  # 2% of screen height
 HUD_LINE_SPACING = int(HEIGHT * 0.03)  # 3% of screen height for line spacing
 HUD_SECTION_SPACING = int(HEIGHT * 0.05)  # 5% for section spacing
 
+# Credits shown bottom right, listed bottom up
+CREDITS_LINES = [
+    "\"Jazz 1\" by Francisco Alvear",
+    "Grok, sound & HUD",
+    "Claude Sonet, core game",
+    "GPT-5 mini, testing",
+    "Gemini, core game"
+]
+
 # Table layout constants
 TABLE_COLUMN_SPACING = int(WIDTH * 0.05)  # 5% of screen width
 TABLE_ROW_SPACING = int(HEIGHT * 0.04)  # 4% of screen height
 
-def get_frame_time() -> float:
-    """Get the time since last frame, capped to prevent physics glitches.
+# Hall of fame table: headers and the x center of each column
+TABLE_HEADERS = ("Rank", "Score", "Player", "Date", "Time")
+TABLE_WIDTH = min(600, WIDTH * 0.8)  # Responsive table width
+TABLE_COLUMN_CENTERS = []
+_x = WIDTH/2 - TABLE_WIDTH/2
+for _fraction in (0.12, 0.18, 0.25, 0.25, 0.2):
+    TABLE_COLUMN_CENTERS.append(_x + TABLE_WIDTH * _fraction / 2)
+    _x += TABLE_WIDTH * _fraction
+del _x, _fraction
+
+# HUD colors for the top three scores: gold, silver, bronze
+BEST_SCORE_COLORS = ((255, 215, 0), (192, 192, 192), (205, 127, 50))
+
+
+def format_best_scores(scores: list) -> list:
+    """Build the HUD's "Best" lines for the top three scores.
     
+    Args:
+        scores: Score dicts as returned by load_scores/save_new_score
+        
     Returns:
-        float: Time delta in seconds, capped at MAX_DT to prevent physics issues during lag.
-        The first call returns 1/TARGET_FPS.
+        list: (text, color) pairs. Rebuilt only when the score list changes,
+        so draw() doesn't format the same strings every frame.
     """
-    global last_frame_time, frame_times
-    current_time = pygame.time.get_ticks() / 1000.0  # Convert to seconds
-    
-    if last_frame_time == 0:
-        dt = 1.0 / TARGET_FPS
-    else:
-        dt = current_time - last_frame_time
-        
-    # Cap maximum dt to prevent physics glitches during lag spikes
-    dt = min(dt, MAX_DT)
-    
-    # Update frame time tracking
-    frame_times.append(dt)
-    if len(frame_times) > FPS_SAMPLE_SIZE:
-        frame_times.pop(0)
+    return [(f"{s['score']} ({s.get('player', 'Unknown')})", color)
+            for s, color in zip(scores, BEST_SCORE_COLORS)]
+
+
+best_score_lines = format_best_scores(top_scores)
+
+def get_frame_time() -> float:
+    """Get the duration of the last frame, capped to prevent physics glitches.
     
-    last_frame_time = current_time
-    return dt
+    Returns:
+        float: Time delta in seconds as measured by the game clock, capped at
+        MAX_DT to prevent physics issues during lag. Before the clock has
+        ticked it returns 1/TARGET_FPS.
+    """
+    frame_ms = clock.get_time()
+    if frame_ms <= 0:
+        return 1.0 / TARGET_FPS
+    return min(frame_ms / 1000.0, MAX_DT)
 
 def get_current_fps() -> float:
-    """Calculate current FPS based on recent frame times.
+    """Return the current FPS as averaged by the game clock.
     
     Returns:
         float: Current FPS averaged over recent frames. Returns TARGET_FPS
-        if no frames have been processed yet or if time delta is zero.
+        until the clock has enough samples.
+    """
+    fps = clock.get_fps()
+    return fps if fps > 0 else TARGET_FPS
+
+
+# HUD FPS readout, resampled a couple of times a second
+FPS_DISPLAY_INTERVAL = 500  # ms
+_fps_display_time = None
+_fps_display_value = TARGET_FPS
+
+
+def get_display_fps() -> float:
+    """Return the FPS value shown in the HUD.
+    
+    Returns:
+        float: get_current_fps(), sampled at most every FPS_DISPLAY_INTERVAL
+        ms. A steady readout is easier to read and lets the rendered text
+        come from the render_text cache instead of changing every frame.
     """
-    if not frame_times:
-        return TARGET_FPS
-    avg_frame_time = sum(frame_times) / len(frame_times)
-    return 1.0 / avg_frame_time if avg_frame_time > 0 else TARGET_FPS
+    global _fps_display_time, _fps_display_value
+    now = pygame.time.get_ticks()
+    if _fps_display_time is None or now - _fps_display_time >= FPS_DISPLAY_INTERVAL:
+        _fps_display_value = get_current_fps()
+        _fps_display_time = now
+    return _fps_display_value
+
+
+def wait_for_next_frame(presented: bool = False) -> None:
+    """Wait until the next frame is due, then record the frame on the clock.
+    
+    Sleeps for all but the last millisecond (sleep can overshoot by a
+    scheduler tick) and spins only for that remainder, so frames are
+    paced precisely without burning a whole core like a busy loop.
+    If a frame ran late the schedule restarts from now instead of
+    rushing to catch up.
+    
+    Args:
+        presented: True if this frame was flipped to the display. With vsync
+            active that flip has already waited for the refresh, so the
+            frame is only recorded; frames that skip the flip (the idle end
+            screen) still go through the limiter.
+    """
+    global _next_frame
+    if VSYNC_ACTIVE and presented:
+        clock.tick()
+        # Restart the limiter's schedule if a later frame needs it
+        _next_frame = None
+        return
+    now = time.perf_counter()
+    if _next_frame is None:
+        _next_frame = now
+    _next_frame += 1.0 / TARGET_FPS
+    if _next_frame < now:
+        _next_frame = now
+
+    remaining = _next_frame - now
+    if remaining > 0.002:
+        time.sleep(remaining - 0.001)
+    while time.perf_counter() < _next_frame:
+        pass
+
+    # No framerate argument: just measure, the waiting is done above
+    clock.tick()
 
 
 def reset() -> None:
@@ -315,9 +426,10 @@ def reset() -> None:
     and all game state flags (alive, landed, crashed). Also resets the
     mission timer and clears previous landing statistics.
     """
-    global lander_pos, lander_vel, lander_angle, fuel, alive, landed, crashed, pad_x, score, mission_start_time, last_landing_stats
-    lander_pos = [WIDTH * 0.5, HEIGHT * 0.167]  # Start at 1/6 of screen height
-    lander_vel = [0.0, 0.0]
+    global lander_angle, fuel, alive, landed, crashed, pad_x, score, mission_start_time, last_landing_stats
+    # Position and velocity are updated in place; the lists live for the whole run
+    lander_pos[:] = (WIDTH * 0.5, HEIGHT * 0.167)  # Start at 1/6 of screen height
+    lander_vel[:] = (0.0, 0.0)
     lander_angle = 0.0
     fuel = 100.0
     alive = True
@@ -328,92 +440,160 @@ def reset() -> None:
     last_landing_stats = None
     pad_x = random.randint(min_pad_margin, WIDTH - min_pad_margin - pad_width)
     # Restore background music volume to normal level
-    pygame.mixer.music.set_volume(0.3)
+    pygame.mixer.music.set_volume(MUSIC_VOLUME)
     # Stop thrust sound if playing
     global thrust_playing
-    if thrust_sound and thrust_playing:
-        thrust_sound.stop()
+    if thrust_playing:
+        get_sound('thrust').stop()
         thrust_playing = False
 
 
-def apply_physics(dt: float) -> None:
-    """Update lander physics based on current controls and time delta.
+# Flame edges splay 0.5 rad either side of the lander axis
+_FLAME_SPREAD_SIN = math.sin(0.5)
+_FLAME_SPREAD_COS = math.cos(0.5)
+
+# Cached sin/cos of lander_angle, shared by physics and drawing each frame
+_trig_angle = None
+_trig_values = (0.0, 1.0, 0.0, 1.0, 0.0, 1.0)
+
+
+def get_angle_trig(angle: float) -> tuple:
+    """Return sin/cos of angle and of angle -/+ 0.5 rad, cached per angle.
     
     Args:
-        dt: Time delta in seconds since last update.
+        angle: Lander angle in degrees
         
-    The function applies:
-    - Rotation based on left/right controls
-    - Main thrust vector based on angle when up/space is pressed
-    - Constant gravity
-    - Fuel consumption for thrusting and rotation
-    - Position integration from velocity
-    - Screen boundary checking
+    Returns:
+        tuple: (sin_a, cos_a, sin_minus, cos_minus, sin_plus, cos_plus).
+        The +/-0.5 rad pair (used for the flame edges) comes from the
+        angle-sum identities, so only one sin and one cos are evaluated,
+        and only when the angle changed since the last call.
+    """
+    global _trig_angle, _trig_values
+    if angle != _trig_angle:
+        rad = math.radians(angle)
+        sin_a, cos_a = math.sin(rad), math.cos(rad)
+        _trig_values = (
+            sin_a, cos_a,
+            sin_a * _FLAME_SPREAD_COS - cos_a * _FLAME_SPREAD_SIN,
+            cos_a * _FLAME_SPREAD_COS + sin_a * _FLAME_SPREAD_SIN,
+            sin_a * _FLAME_SPREAD_COS + cos_a * _FLAME_SPREAD_SIN,
+            cos_a * _FLAME_SPREAD_COS - sin_a * _FLAME_SPREAD_SIN,
+        )
+        _trig_angle = angle
+    return _trig_values
+
+
+# Fuel burn rates, scaled by dt so consumption doesn't depend on frame rate
+BASE_ROTATION_FUEL_RATE = 1.2  # units per second
+BASE_THRUST_FUEL_RATE = 10.0   # units per second
+
+
+def physics_step(x: float, y: float, vx: float, vy: float, angle: float, fuel: float,
+                 dt: float, thrusting: bool, rotating_left: bool, rotating_right: bool,
+                 can_fly: bool) -> tuple:
+    """Advance the lander state by one time step.
+    
+    The numeric core of the physics: it takes and returns plain floats and
+    does no I/O or sound, so the per-frame math runs on locals instead of
+    module globals and list items. It still reads the physics constants and
+    shares the sin/cos cache in get_angle_trig().
+    
+    Args:
+        x, y: Lander position
+        vx, vy: Lander velocity (pixels/second)
+        angle: Lander angle in degrees
+        fuel: Remaining fuel
+        dt: Time delta in seconds
+        thrusting, rotating_left, rotating_right: Control inputs
+        can_fly: False once the lander has landed or crashed
+        
+    Returns:
+        tuple: (x, y, vx, vy, angle, fuel, firing) where firing is True
+        if the main engine fired during this step.
     """
-    global lander_pos, lander_vel, lander_angle, fuel
-
-    # Controls
-    thrusting = keyboard.space or keyboard.up
-    rotating_left = keyboard.left
-    rotating_right = keyboard.right
-
-    # Scale fuel consumption to maintain consistent rates regardless of frame rate
-    BASE_ROTATION_FUEL_RATE = 1.2  # units per second
-    BASE_THRUST_FUEL_RATE = 10.0   # units per second
-
     # Rotation
-    if rotating_left and fuel > 0 and alive and not landed:
-        lander_angle -= ROTATION_SPEED * dt
+    if rotating_left and fuel > 0 and can_fly:
+        angle -= ROTATION_SPEED * dt
         fuel -= BASE_ROTATION_FUEL_RATE * dt
-    if rotating_right and fuel > 0 and alive and not landed:
-        lander_angle += ROTATION_SPEED * dt
+    if rotating_right and fuel > 0 and can_fly:
+        angle += ROTATION_SPEED * dt
         fuel -= BASE_ROTATION_FUEL_RATE * dt
 
-    # Keep angle in [-180, 180]
-    if lander_angle > 180:
-        lander_angle -= 360
-    if lander_angle < -180:
-        lander_angle += 360
+    # Keep angle in [-180, 180)
+    angle = (angle + 180.0) % 360.0 - 180.0
 
     # Thrust
-    if thrusting and fuel > 0 and alive and not landed:
-        # Convert angle to radians. In our coordinate system 0 deg = up (-y)
-        rad = math.radians(lander_angle)
+    firing = bool(thrusting and fuel > 0 and can_fly)
+    if firing:
+        # In our coordinate system 0 deg = up (-y)
+        sin_a, cos_a = get_angle_trig(angle)[:2]
         # Thrust vector: angle 0 pushes up (negative y)
-        ax = math.sin(rad) * MAIN_THRUST
-        ay = -math.cos(rad) * MAIN_THRUST
-        lander_vel[0] += ax * dt
-        lander_vel[1] += ay * dt
+        vx += sin_a * MAIN_THRUST * dt
+        vy -= cos_a * MAIN_THRUST * dt
         # consume fuel faster when thrusting
         fuel -= BASE_THRUST_FUEL_RATE * dt
         if fuel < 0:
             fuel = 0.0
-        
-        # Start thrust sound if not already playing
-        global thrust_playing
-        if thrust_sound and not thrust_playing:
-            thrust_sound.play(-1)  # -1 means loop indefinitely
-            thrust_playing = True
-    else:
-        # Stop thrust sound if it was playing
-        if thrust_sound and thrust_playing:
-            thrust_sound.stop()
-            thrust_playing = False
 
     # Gravity
-    lander_vel[1] += GRAVITY * dt
+    vy += GRAVITY * dt
 
     # Integrate
-    lander_pos[0] += lander_vel[0] * dt
-    lander_pos[1] += lander_vel[1] * dt
+    x += vx * dt
+    y += vy * dt
 
     # Keep in horizontal bounds
-    if lander_pos[0] < 0:
-        lander_pos[0] = 0
-        lander_vel[0] = 0
-    if lander_pos[0] > WIDTH:
-        lander_pos[0] = WIDTH
-        lander_vel[0] = 0
+    if x < 0:
+        x = 0
+        vx = 0
+    if x > WIDTH:
+        x = WIDTH
+        vx = 0
+
+    return x, y, vx, vy, angle, fuel, firing
+
+
+def apply_physics(dt: float, keys=None) -> None:
+    """Update lander physics based on current controls and time delta.
+    
+    Args:
+        dt: Time delta in seconds since last update.
+        keys: Key state snapshot from pygame.key.get_pressed() for this frame
+            (polled here if not given).
+        
+    The function applies:
+    - Rotation based on left/right controls
+    - Main thrust vector based on angle when up/space is pressed
+    - Constant gravity
+    - Fuel consumption for thrusting and rotation
+    - Position integration from velocity
+    - Screen boundary checking
+    """
+    global lander_angle, fuel, thrust_playing
+
+    # Controls
+    if keys is None:
+        keys = pygame.key.get_pressed()
+    thrusting = keys[pygame.K_SPACE] or keys[pygame.K_UP]
+
+    (lander_pos[0], lander_pos[1], lander_vel[0], lander_vel[1],
+     lander_angle, fuel, firing) = physics_step(
+        lander_pos[0], lander_pos[1], lander_vel[0], lander_vel[1],
+        lander_angle, fuel, dt, thrusting, keys[pygame.K_LEFT],
+        keys[pygame.K_RIGHT], alive and not landed)
+
+    if firing:
+        # Start thrust sound if not already playing
+        if not thrust_playing:
+            thrust_sound = get_sound('thrust')
+            if thrust_sound:
+                thrust_sound.play(-1)  # -1 means loop indefinitely
+                thrust_playing = True
+    elif thrust_playing:
+        # Stop thrust sound if it was playing
+        get_sound('thrust').stop()
+        thrust_playing = False
 
 
 def calculate_landing_score(vx: float, vy: float, landing_x: float, mission_time: int) -> int:
@@ -444,7 +624,7 @@ def calculate_landing_score(vx: float, vy: float, landing_x: float, mission_time
     score = 1000
 
     # Speed bonus (better score for softer landing)
-    speed = math.sqrt(vx*vx + vy*vy)
+    speed = math.hypot(vx, vy)
     speed_score = int(500 * (1.0 - min(1.0, speed/60.0)))
     
     # Position bonus (better score for landing closer to pad center)
@@ -474,8 +654,9 @@ def calculate_landing_score(vx: float, vy: float, landing_x: float, mission_time
     }
     
     # Save score and update top scores
-    global top_scores
-    top_scores = save_new_score(total_score, last_landing_stats, current_player_name)
+    global top_scores, best_score_lines
+    top_scores = save_new_score(total_score, last_landing_stats, current_player_name, top_scores)
+    best_score_lines = format_best_scores(top_scores)
     
     return total_score
 
@@ -516,6 +697,7 @@ def check_collision() -> None:
             mission_time = pygame.time.get_ticks() - mission_start_time
             score = calculate_landing_score(vx, vy, lander_pos[0], mission_time)
             # Play landing success sound if available
+            landing_sound = get_sound('landing')
             if landing_sound:
                 landing_sound.play()
         else:
@@ -526,66 +708,157 @@ def check_collision() -> None:
             lander_pos[1] = surface_y - lander_size / 2
             score = 0  # No score for crashing
             # Play crash sound if available
+            crash_sound = get_sound('crash')
             if crash_sound:
                 # Temporarily lower background music volume for crash sound
-                original_music_volume = pygame.mixer.music.get_volume()
-                pygame.mixer.music.set_volume(0.1)  # Lower to 10%
+                pygame.mixer.music.set_volume(CRASH_MUSIC_VOLUME)
                 crash_sound.play()
                 # Note: Music volume will be restored on next game reset
 
 
-def draw_lander(surface: pygame.Surface) -> None:
+def create_star_field() -> list:
+    """Create the three parallax star layers.
+    
+    Returns:
+        list: One dict per layer (back to front) holding parallel lists
+        'x', 'y', 'size', 'palette', 'twinkle_speed' and 'twinkle_offset'.
+        'palette' holds the star's color (tint scaled by brightness) at
+        each of the STAR_TWINKLE_STEPS twinkle levels, so drawing only
+        has to pick an entry.
+    """
+    field = []
+    uniform = random.uniform
+    for layer, n in enumerate(STAR_LAYER_COUNTS):
+        size_min, size_max = STAR_LAYER_SIZES[layer]
+        # Draw each attribute for the whole layer in one pass
+        brightness = [uniform(0.5, 1.0) for _ in range(n)]
+        tints = random.choices(STAR_TINTS, k=n)  # Random color tint
+        field.append({
+            # Random position, only in upper 70% of screen
+            'x': [uniform(0, WIDTH) for _ in range(n)],
+            'y': [uniform(0, HEIGHT * 0.7) for _ in range(n)],
+            # Random size (bigger in front layers)
+            'size': [uniform(size_min, size_max) for _ in range(n)],
+            'palette': [tuple(tuple(int(c * b * (0.7 + 0.3 * i / (STAR_TWINKLE_STEPS - 1))) for c in tint)
+                              for i in range(STAR_TWINKLE_STEPS))
+                        for tint, b in zip(tints, brightness)],
+            # Twinkle speed and random phase
+            'twinkle_speed': [uniform(1, 3) for _ in range(n)],
+            'twinkle_offset': [uniform(0, 6.28) for _ in range(n)],
+        })
+    return field
+
+
+def draw_star_field(surface: pygame.Surface, current_time: float) -> None:
+    """Scroll the star layers with the lander's horizontal velocity and draw them.
+    
+    Args:
+        surface: Pygame surface to draw on
+        current_time: Time in seconds, drives the twinkle animation
+    """
+    frame_dt = 1.0 / TARGET_FPS  # Use target frame time for smooth movement
+    sin = math.sin  # local binding for the per-star loop
+    half_steps = (STAR_TWINKLE_STEPS - 1) / 2
+    # Lock once for the whole field; set_at and draw.circle would
+    # otherwise lock and unlock the surface for every single star
+    surface.lock()
+    try:
+        for layer, stars in enumerate(star_field):
+            # Different parallax speeds for each layer
+            dx = lander_vel[0] * STAR_PARALLAX_SPEEDS[layer] * frame_dt
+            if dx:
+                stars['x'] = [(x - dx) % WIDTH for x in stars['x']]
+            xs = stars['x']
+
+            for x, y, size, palette, speed, offset in zip(
+                    xs, stars['y'], stars['size'], stars['palette'],
+                    stars['twinkle_speed'], stars['twinkle_offset']):
+                # pygame.draw.circle draws nothing for a radius below 1, so skip
+                # the twinkle math for stars that would not show up anyway
+                if 1 < size < 2:
+                    continue
+
+                # Twinkle between 70% and 100% brightness, picked from the
+                # star's precomputed palette (sin -1..1 -> level 0..steps-1)
+                color = palette[int((sin(current_time * speed + offset) + 1.0) * half_steps + 0.5)]
+
+                # Draw star based on size
+                if size <= 1:
+                    surface.set_at((int(x), int(y)), color)
+                else:
+                    pygame.draw.circle(surface, color, (int(x), int(y)), size / 2)
+    finally:
+        surface.unlock()
+
+
+# Rotated lander sprites, one (surface, blit offset) per integer degree
+_rotated_lander_cache = [None] * 360
+_rotated_lander_source = None
+
+
+def get_rotated_lander(sprite: pygame.Surface, angle: float) -> tuple[pygame.Surface, tuple[int, int]]:
+    """Return sprite rotated by angle (degrees, clockwise), cached per degree.
+    
+    Args:
+        sprite: Unrotated lander sprite
+        angle: Lander angle in degrees; rounded to the nearest whole degree
+        
+    Returns:
+        tuple: (rotated sprite converted for fast blitting, (dx, dy) offset
+        from the lander center to the sprite's top-left corner)
+    
+    All 360 rotations are baked the first time a sprite is seen (about
+    10 ms for the 64px sprite), so nothing is rotated during play. The
+    cache is rebuilt if a different source sprite is passed in (e.g.
+    after the asset was reloaded).
+    """
+    global _rotated_lander_source
+    if sprite is not _rotated_lander_source:
+        for index in range(360):
+            # Negative angle for clockwise rotation
+            rotated = pygame.transform.rotate(sprite, -index).convert_alpha()
+            width, height = rotated.get_size()
+            _rotated_lander_cache[index] = (rotated, (-(width // 2), -(height // 2)))
+        _rotated_lander_source = sprite
+    return _rotated_lander_cache[int(round(angle)) % 360]
+
+
+def draw_lander(surface: pygame.Surface, keys=None) -> None:
     """Draw the lander sprite and optional thrust flame on the given surface.
     
     Args:
         surface: Pygame surface to draw on
+        keys: Key state snapshot for this frame (polled here if not given)
         
     The lander sprite is loaded from assets/lander.png. When thrusting,
     a simple triangle flame effect is drawn behind the lander, rotated
     to match the lander's orientation. The flame size is randomly varied
     to create a flickering effect.
     
-    Side effects:
-        May create/update lander_sprite and flame_sprite globals on first call
-        Logs an error if lander sprite cannot be loaded
+    The sprite is loaded once at startup; if that failed nothing is drawn.
     """
-    global lander_sprite, flame_sprite
-
-    # Prepare asset path (always defined for error reporting)
-    lander_path = os.path.join('assets', 'lander.png')
-    try:
-        # Use central asset loader (handles PyInstaller bundles)
-        lander_sprite = load_image(lander_path)
-        # Create a simple flame sprite
-        flame_size = (32, 48)
-        flame_sprite = pygame.Surface(flame_size, pygame.SRCALPHA)
-        flame_points = [(16, 0), (32, 48), (0, 48)]
-        pygame.draw.polygon(flame_sprite, (255, 120, 20), flame_points, 0)
-    except Exception as e:
-        print(f"Error loading lander sprite from {lander_path}: {e}")
+    if lander_sprite is None:
         return
 
-    # Get the rect for positioning
     cx, cy = lander_pos
-    sprite_rect = lander_sprite.get_rect()
-    sprite_rect.center = (int(cx), int(cy))
     
-    # Rotate the sprite
-    rotated_lander = pygame.transform.rotate(lander_sprite, -lander_angle)  # Negative angle for clockwise rotation
-    rotated_rect = rotated_lander.get_rect(center=sprite_rect.center)
+    # Rotated sprite (pre-baked per whole degree), centered on the lander
+    rotated_lander, (dx, dy) = get_rotated_lander(lander_sprite, lander_angle)
     
     # Draw the lander
-    surface.blit(rotated_lander, rotated_rect)
+    surface.blit(rotated_lander, (int(cx) + dx, int(cy) + dy))
     
     # Draw flame if thrusting
-    if (keyboard.space or keyboard.up) and fuel > 0 and alive and not landed:
+    if keys is None:
+        keys = pygame.key.get_pressed()
+    if (keys[pygame.K_SPACE] or keys[pygame.K_UP]) and fuel > 0 and alive and not landed:
         # Calculate flame position based on lander's angle
-        rad = math.radians(lander_angle)
+        sin_a, cos_a, sin_m, cos_m, sin_p, cos_p = get_angle_trig(lander_angle)
         offset = 20  # Distance from lander center to flame start
         
         # Calculate flame base position (at bottom of lander based on angle)
-        flame_base_x = cx - math.sin(rad) * offset
-        flame_base_y = cy + math.cos(rad) * offset
+        flame_base_x = cx - sin_a * offset
+        flame_base_y = cy + cos_a * offset
         
         # Create flame points relative to base position
         flame_length = 30 * (0.8 + random.random() * 0.4)  # Animated length
@@ -593,21 +866,121 @@ def draw_lander(surface: pygame.Surface) -> None:
         
         flame_points = [
             (flame_base_x, flame_base_y),  # Top point
-            (flame_base_x - math.sin(rad - 0.5) * flame_width,  # Left point
-             flame_base_y + math.cos(rad - 0.5) * flame_width),
-            (flame_base_x - math.sin(rad) * flame_length,      # Bottom point
-             flame_base_y + math.cos(rad) * flame_length),
-            (flame_base_x - math.sin(rad + 0.5) * flame_width,  # Right point
-             flame_base_y + math.cos(rad + 0.5) * flame_width),
+            (flame_base_x - sin_m * flame_width,  # Left point
+             flame_base_y + cos_m * flame_width),
+            (flame_base_x - sin_a * flame_length,      # Bottom point
+             flame_base_y + cos_a * flame_length),
+            (flame_base_x - sin_p * flame_width,  # Right point
+             flame_base_y + cos_p * flame_width),
         ]
         
         # Draw flame
         pygame.draw.polygon(surface, (255, 120, 20), flame_points, 0)
 
 
-def draw() -> None:
+# Static background, rebuilt only when the pad moves
+_background = None
+_background_pad_x = None
+
+
+def get_background() -> pygame.Surface:
+    """Return the sky, moon surface and landing pad as one display surface.
+    
+    None of it changes during a mission, so it is drawn once per pad
+    position and then blitted every frame.
+    """
+    global _background, _background_pad_x
+    if _background is None or _background_pad_x != pad_x:
+        background = pygame.Surface((WIDTH, HEIGHT)).convert()
+        background.fill((10, 10, 30))
+
+        # Moon surface
+        surface_y = HEIGHT - 40
+        pygame.draw.rect(background, (80, 80, 80), pygame.Rect(0, surface_y, WIDTH, HEIGHT - surface_y))
+
+        # Landing pad
+        pygame.draw.rect(background, (255, 255, 0), pygame.Rect(pad_x, pad_y, pad_width, pad_height))
+        pygame.draw.rect(background, (0, 0, 0), pygame.Rect(pad_x, pad_y, pad_width, pad_height), 1)
+
+        _background = background
+        _background_pad_x = pad_x
+    return _background
+
+
+# Cached end screen text: the state it was laid out for and its blit list
+_end_screen_key = None
+_end_screen_blits = []
+
+# True once the (static) landed/crashed screen has been presented
+end_screen_shown = False
+
+
+@functools.lru_cache(maxsize=256)
+def render_text(text: str, color: tuple[int, int, int]) -> tuple[pygame.Surface, pygame.Surface]:
+    """Render text in FONT as a (black shadow, colored) surface pair.
+    
+    Results are cached, so static HUD lines are only rendered once and
+    changing values (fuel, velocity, ...) reuse recent renders.
+    """
+    lit = FONT.render(text, True, color).convert_alpha()
+    # The shadow is the same glyph coverage in black: zero RGB, keep alpha
+    shadow = lit.copy()
+    shadow.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MULT)
+    return shadow, lit
+
+
+def render_credits() -> tuple[pygame.Surface, tuple[int, int]]:
+    """Pre-render the credits block (bottom right) into a single surface.
+    
+    Returns:
+        tuple: (surface, topleft) ready to blit onto DISPLAY
+    """
+    credits_x = WIDTH - HUD_LEFT_MARGIN
+    credits_y = HEIGHT - HUD_BOTTOM_MARGIN
+    small_font_size = int(HEIGHT * 16/600)  # Smaller font for credits
+    small_font = pygame.font.SysFont(None, small_font_size)
+    shadow_offset = 1
+    
+    # Lay the lines out from the bottom up, shadow before text
+    parts = []
+    for i, line in enumerate(CREDITS_LINES):
+        text_surface = small_font.render(line, True, (0, 0, 0))
+        text_lit = small_font.render(line, True, (150, 120, 120))
+        text_rect = text_surface.get_rect()
+        text_rect.right = credits_x
+        text_rect.bottom = credits_y - i * int(small_font_size * 0.8)
+        parts.append((text_surface, text_rect.move(shadow_offset, shadow_offset)))
+        parts.append((text_lit, text_rect))
+    
+    bounds = parts[0][1].unionall([rect for _, rect in parts[1:]])
+    surf = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    for image, rect in parts:
+        surf.blit(image, rect.move(-bounds.x, -bounds.y))
+    return surf.convert_alpha(), bounds.topleft
+
+
+@functools.lru_cache(maxsize=4)
+def get_overlay(alpha: int) -> pygame.Surface:
+    """Return a screen-sized black surface with the given alpha.
+    
+    Cached so the dialogs don't allocate and fill a new one every frame.
+    """
+    overlay = pygame.Surface((WIDTH, HEIGHT)).convert()
+    overlay.fill((0, 0, 0))
+    overlay.set_alpha(alpha)
+    return overlay
+
+
+def draw(keys=None) -> bool:
     """Draw the complete game scene.
     
+    Args:
+        keys: Key state snapshot for this frame (polled if not given)
+    
+    Returns:
+        bool: True if a frame was presented with flip(), False if the
+        already shown end screen was left as it is.
+    
     Renders in order:
     1. Background with parallax star field
     2. Moon surface and landing pad
@@ -615,86 +988,33 @@ def draw() -> None:
     4. HUD with flight data, score, and player info
     5. Text overlays for name input and landing results
     
-    The star field is created once and cached in a global;
+    The star field is created once at startup (see create_star_field);
     stars move with parallax based on lander velocity.
+    
+    Once the landed/crashed screen has been presented nothing is redrawn
+    until the game is reset or the window needs repainting.
     """
-    DISPLAY.fill((10, 10, 30))
-
-    # Initialize star field if not exists
-    if 'star_field' not in globals():
-        global star_field
-        star_field = []
-        # Create three layers of stars for parallax effect
-        for layer in range(3):
-            layer_stars = []
-            num_stars = 50 if layer == 0 else 30 if layer == 1 else 20
-            for _ in range(num_stars):
-                # Random position
-                x = random.uniform(0, WIDTH)
-                y = random.uniform(0, HEIGHT * 0.7)  # Only in upper 70% of screen
-                # Random size (bigger in front layers)
-                size = random.uniform(1, 2) if layer == 0 else \
-                       random.uniform(1.5, 2.5) if layer == 1 else \
-                       random.uniform(2, 3)
-                # Random brightness
-                brightness = random.uniform(0.5, 1.0)
-                # Random color tint (slight blue/red variations)
-                color_tint = random.choice([
-                    (255, 255, 255),  # White
-                    (255, 255, 220),  # Warm white
-                    (220, 220, 255),  # Cool white
-                    (255, 220, 220),  # Slight red
-                    (240, 240, 255)   # Slight blue
-                ])
-                # Twinkle speed
-                twinkle_speed = random.uniform(1, 3)
-                layer_stars.append({
-                    'x': x, 'y': y, 'size': size, 'brightness': brightness,
-                    'color': color_tint, 'twinkle_speed': twinkle_speed,
-                    'twinkle_offset': random.uniform(0, 6.28)  # Random phase
-                })
-            star_field.append(layer_stars)
-
-    # Draw stars with parallax effect
-    current_time = pygame.time.get_ticks() / 1000.0  # Time in seconds
-    
-    for layer, stars in enumerate(star_field):
-        # Different parallax speeds for each layer
-        parallax_speed = (0.2, 0.1, 0.05)[layer]
-        frame_dt = 1.0 / TARGET_FPS  # Use target frame time for smooth movement
-        dx = lander_vel[0] * parallax_speed * frame_dt
-        
-        for star in stars:
-            # Update star position with parallax
-            star['x'] = (star['x'] - dx) % WIDTH
-            
-            # Calculate twinkle effect
-            twinkle = (math.sin(current_time * star['twinkle_speed'] + 
-                              star['twinkle_offset']) + 1) * 0.5 * 0.3 + 0.7
-            
-            # Apply brightness and twinkle
-            color = tuple(int(c * star['brightness'] * twinkle) for c in star['color'])
-            
-            # Draw star based on size
-            if star['size'] <= 1:
-                DISPLAY.set_at((int(star['x']), int(star['y'])), color)
-            else:
-                pygame.draw.circle(DISPLAY, color, 
-                                (int(star['x']), int(star['y'])), 
-                                star['size'] / 2)
-
-    # Moon surface
-    surface_y = HEIGHT - 40
-    pygame.draw.rect(DISPLAY, (80, 80, 80), pygame.Rect(0, surface_y, WIDTH, HEIGHT - surface_y))
-
-    # Landing pad
-    pygame.draw.rect(DISPLAY, (255, 255, 0), pygame.Rect(pad_x, pad_y, pad_width, pad_height))
-    pygame.draw.rect(DISPLAY, (0, 0, 0), pygame.Rect(pad_x, pad_y, pad_width, pad_height), 1)
+    global _end_screen_key, _end_screen_blits, end_screen_shown
+
+    # After landing or crashing nothing moves until the player acts, so
+    # once the end screen is on the display it is left there
+    if (landed or crashed) and end_screen_shown:
+        return False
+
+    # Sky, moon surface and landing pad
+    DISPLAY.blit(get_background(), (0, 0))
+
+    # Stars with parallax effect (upper 70% only, so they never overlap
+    # the ground and can go on top of the background)
+    draw_star_field(DISPLAY, pygame.time.get_ticks() / 1000.0)
 
     # Lander
-    draw_lander(DISPLAY)
+    draw_lander(DISPLAY, keys)
 
-    def draw_text_with_shadow(text: str, color: tuple[int, int, int], position: tuple[float | int, float | int], align: str = "left") -> int:
+    # Text is queued here and drawn with a single DISPLAY.blits() call
+    frame_blits = []
+
+    def draw_text_with_shadow(text: str, color: tuple[int, int, int], position: tuple[float | int, float | int], align: str = "left", blits: list | None = None) -> int:
         """Draw text with a drop shadow for better legibility.
         
         Args:
@@ -702,16 +1022,18 @@ def draw() -> None:
             color: RGB color tuple for the text
             position: (x, y) coordinates for text position (can be float or int)
             align: Text alignment - "left", "center", or "right" (default: "left")
+            blits: List the (surface, position) pairs are queued on
+                (default: this frame's text queue, frame_blits)
             
         Returns:
             int: Y coordinate below the drawn text (useful for vertically stacking text)
             
         The text is drawn twice - once in black offset by 1 pixel for the shadow,
         then again in the specified color. The shadow helps text readability.
+        Nothing is drawn here; the pairs are queued for a batched blits() call.
         """
         shadow_offset = 1
-        text_surface = FONT.render(text, True, (0, 0, 0))
-        text_lit = FONT.render(text, True, color)
+        text_surface, text_lit = render_text(text, color)
         text_rect = text_surface.get_rect()
         
         # Convert position coordinates to integers
@@ -727,23 +1049,18 @@ def draw() -> None:
             text_rect.left = x
             text_rect.top = y
             
-        # Draw shadow first
-        shadow_rect = text_rect.copy()
-        shadow_rect.x += shadow_offset
-        shadow_rect.y += shadow_offset
-        DISPLAY.blit(text_surface, shadow_rect)
-        # Draw actual text
-        DISPLAY.blit(text_lit, text_rect)
+        # Shadow first, then the actual text
+        if blits is None:
+            blits = frame_blits
+        blits.append((text_surface, (text_rect.x + shadow_offset, text_rect.y + shadow_offset)))
+        blits.append((text_lit, text_rect))
         
         return text_rect.bottom + HUD_LINE_SPACING  # Use consistent line spacing
         
     # Name input dialog (delegated to TextInputHandler)
     if text_input.entering:
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        DISPLAY.blit(overlay, (0, 0))
+        DISPLAY.blit(get_overlay(180), (0, 0))
 
         # Draw input box
         input_y = HEIGHT * 0.4
@@ -752,40 +1069,8 @@ def draw() -> None:
         draw_text_with_shadow(input_text, (255, 255, 255), (WIDTH/2, input_y + HUD_LINE_SPACING * 2), "center")
         draw_text_with_shadow("Press Enter to save, Esc to cancel", (150, 150, 150), (WIDTH/2, input_y + HUD_LINE_SPACING * 4), "center")
     
-        draw_text_with_shadow("Press Enter to save, Esc to cancel", (150, 150, 150), (WIDTH/2, input_y + HUD_LINE_SPACING * 4), "center")
-    
     # Credits display (always visible, small in bottom right)
-    credits_x = WIDTH - HUD_LEFT_MARGIN
-    credits_y = HEIGHT - HUD_BOTTOM_MARGIN
-    small_font_size = int(HEIGHT * 16/600)  # Smaller font for credits
-    small_font = pygame.font.SysFont(None, small_font_size)
-    
-    # Draw credits from bottom up
-    credits_lines = [
-        "\"Jazz 1\" by Francisco Alvear",
-        "Grok, sound & HUD",
-        "Claude Sonet, core game", 
-        "GPT-5 mini, testing",
-        "Gemini, core game"
-    ]
-    
-    for i, line in enumerate(credits_lines):
-        # Use small font for credits
-        shadow_offset = 1
-        text_surface = small_font.render(line, True, (0, 0, 0))
-        text_lit = small_font.render(line, True, (150, 120, 120))
-        text_rect = text_surface.get_rect()
-        
-        text_rect.right = credits_x
-        text_rect.bottom = credits_y - i * int(small_font_size * 0.8)
-        
-        # Draw shadow first
-        shadow_rect = text_rect.copy()
-        shadow_rect.x += shadow_offset
-        shadow_rect.y += shadow_offset
-        DISPLAY.blit(text_surface, shadow_rect)
-        # Draw actual text
-        DISPLAY.blit(text_lit, text_rect)
+    frame_blits.append((credits_surf, credits_pos))
     
     # HUD Layout
     left_margin = HUD_LEFT_MARGIN
@@ -799,11 +1084,12 @@ def draw() -> None:
     fuel_color = (0, 255, 0) if fuel > 30 else (255, 255, 0) if fuel > 10 else (255, 0, 0)
     y_pos = draw_text_with_shadow(f"Fuel: {fuel:.0f}", fuel_color, (left_margin, y_pos))
     
-    vel_magnitude = math.sqrt(lander_vel[0]**2 + lander_vel[1]**2)
+    vel_magnitude = math.hypot(lander_vel[0], lander_vel[1])
     vel_color = (0, 255, 0) if vel_magnitude < 30 else (255, 255, 0) if vel_magnitude < 45 else (255, 0, 0)
     y_pos = draw_text_with_shadow(f"Velocity: {vel_magnitude:.1f}", vel_color, (left_margin, y_pos))
     
-    angle_color = (0, 255, 0) if abs(lander_angle) < 10 else (255, 255, 0) if abs(lander_angle) < 25 else (255, 0, 0)
+    tilt = abs(lander_angle)
+    angle_color = (0, 255, 0) if tilt < 10 else (255, 255, 0) if tilt < 25 else (255, 0, 0)
     y_pos = draw_text_with_shadow(f"Angle: {lander_angle:.1f}°", angle_color, (left_margin, y_pos))
     
     # Right panel - Score & Performance
@@ -816,111 +1102,112 @@ def draw() -> None:
         mission_time = (pygame.time.get_ticks() - mission_start_time) // 1000
         y_pos_right = draw_text_with_shadow(f"Mission Time: {mission_time}s", (200, 200, 200), (right_margin, y_pos_right), "right")
         
-        current_fps = get_current_fps()
+        current_fps = get_display_fps()
         fps_color = (0, 255, 0) if current_fps >= TARGET_FPS - 5 else \
                    (255, 255, 0) if current_fps >= TARGET_FPS - 15 else \
                    (255, 0, 0)
-        y_pos_right = draw_text_with_shadow(f"FPS: {current_fps:.1f}", fps_color, (right_margin, y_pos_right), "right")
+        y_pos_right = draw_text_with_shadow(f"FPS: {current_fps:.0f}{' (vsync)' if VSYNC_ACTIVE else ''}", fps_color, (right_margin, y_pos_right), "right")
     
     # Top Scores - Compact display
     if top_scores:
         y_pos_right = draw_text_with_shadow("Best: ", (200, 200, 200), (right_margin, y_pos_right), "right")
-        for i, score_data in enumerate(top_scores[:3]):
-            score_color = (255, 215, 0) if i == 0 else (192, 192, 192) if i == 1 else (205, 127, 50)  # Gold, Silver, Bronze
-            player_name = score_data.get('player', 'Unknown')
-            y_pos_right = draw_text_with_shadow(f"{score_data['score']} ({player_name})", score_color, (right_margin, y_pos_right), "right")
+        for text, score_color in best_score_lines:
+            y_pos_right = draw_text_with_shadow(text, score_color, (right_margin, y_pos_right), "right")
+
+    # Draw the dialog, credits and HUD text queued so far
+    DISPLAY.blits(frame_blits, doreturn=0)
 
     if landed or crashed:
         # Semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        DISPLAY.blit(overlay, (0, 0))
+        DISPLAY.blit(get_overlay(128), (0, 0))
         
-        y_pos = HEIGHT * 0.2
+        # The end screen only changes with the landing and the score table,
+        # so its layout and text lookups are redone only when those change;
+        # every other frame replays the cached blits
+        end_key = (landed, crashed, last_landing_stats, f"{fuel:.0f}",
+                   [(s['score'], s.get('player'), s['date']) for s in top_scores[:5]])
+        if end_key != _end_screen_key:
+            end_blits = []
+            y_pos = HEIGHT * 0.2
         
-        if landed:
-            # Landing message
-            y_pos = draw_text_with_shadow("SUCCESSFUL LANDING!", (0, 255, 0), (WIDTH/2, y_pos), "center")
-            y_pos = draw_text_with_shadow("Press R to play again", (200, 200, 200), (WIDTH/2, y_pos), "center")
+            if landed:
+                # Landing message
+                y_pos = draw_text_with_shadow("SUCCESSFUL LANDING!", (0, 255, 0), (WIDTH/2, y_pos), "center", end_blits)
+                y_pos = draw_text_with_shadow("Press R to play again", (200, 200, 200), (WIDTH/2, y_pos), "center", end_blits)
             
-            if last_landing_stats:
-                stats = last_landing_stats
-                y_pos += HUD_SECTION_SPACING
-                
-                # Current landing summary
-                total_color = (255, 215, 0)  # Gold color for total score
-                y_pos = draw_text_with_shadow(f"FINAL SCORE: {stats['total']}", total_color, (WIDTH/2, y_pos), "center")
-                y_pos += HUD_SECTION_SPACING
+                if last_landing_stats:
+                    stats = last_landing_stats
+                    y_pos += HUD_SECTION_SPACING
                 
-                # Breakdown in columns
-                col1_x = WIDTH/2 - 200
-                col2_x = WIDTH/2 + 200
-                row_y = y_pos
+                    # Current landing summary
+                    total_color = (255, 215, 0)  # Gold color for total score
+                    y_pos = draw_text_with_shadow(f"FINAL SCORE: {stats['total']}", total_color, (WIDTH/2, y_pos), "center", end_blits)
+                    y_pos += HUD_SECTION_SPACING
                 
-                # Left column
-                draw_text_with_shadow(f"Landing Speed: {stats['speed_value']:.1f}", (200, 200, 100), (col1_x, row_y), "center")
-                draw_text_with_shadow(f"Position Accuracy: {100 - (stats['distance']/(pad_width/2)*100):.0f}%", (200, 200, 100), (col2_x, row_y), "center")
-                row_y += TABLE_ROW_SPACING
+                    # Breakdown in columns
+                    col1_x = WIDTH/2 - 200
+                    col2_x = WIDTH/2 + 200
+                    row_y = y_pos
                 
-                draw_text_with_shadow(f"Fuel Remaining: {fuel:.0f}", (200, 200, 100), (col1_x, row_y), "center")
-                draw_text_with_shadow(f"Mission Time: {stats['mission_time']/1000:.1f}s", (200, 200, 100), (col2_x, row_y), "center")
+                    # Left column
+                    draw_text_with_shadow(f"Landing Speed: {stats['speed_value']:.1f}", (200, 200, 100), (col1_x, row_y), "center", end_blits)
+                    draw_text_with_shadow(f"Position Accuracy: {100 - (stats['distance']/(pad_width/2)*100):.0f}%", (200, 200, 100), (col2_x, row_y), "center", end_blits)
+                    row_y += TABLE_ROW_SPACING
                 
-                # Top Scores Table
-                y_pos = row_y + HUD_SECTION_SPACING
-                draw_text_with_shadow("HALL OF FAME", (255, 255, 255), (WIDTH/2, y_pos), "center")
-                y_pos += HUD_SECTION_SPACING
+                    draw_text_with_shadow(f"Fuel Remaining: {fuel:.0f}", (200, 200, 100), (col1_x, row_y), "center", end_blits)
+                    draw_text_with_shadow(f"Mission Time: {stats['mission_time']/1000:.1f}s", (200, 200, 100), (col2_x, row_y), "center", end_blits)
                 
-                # Compact score table
-                table_width = min(600, WIDTH * 0.8)  # Responsive table width
-                col_widths = [table_width * 0.12, table_width * 0.18, table_width * 0.25, table_width * 0.25, table_width * 0.2]  # Rank, Score, Player, Date, Time
-                x_start = WIDTH/2 - table_width/2
+                    # Top Scores Table
+                    y_pos = row_y + HUD_SECTION_SPACING
+                    draw_text_with_shadow("HALL OF FAME", (255, 255, 255), (WIDTH/2, y_pos), "center", end_blits)
+                    y_pos += HUD_SECTION_SPACING
                 
-                # Headers
-                headers = ["Rank", "Score", "Player", "Date", "Time"]
-                x = x_start
-                for header, width in zip(headers, col_widths):
-                    draw_text_with_shadow(header, (150, 150, 150), (x + width/2, y_pos), "center")
-                    x += width
+                    # Headers (compact table, column centers precomputed)
+                    for header, col_x in zip(TABLE_HEADERS, TABLE_COLUMN_CENTERS):
+                        draw_text_with_shadow(header, (150, 150, 150), (col_x, y_pos), "center", end_blits)
                 
-                y_pos += TABLE_ROW_SPACING
+                    y_pos += TABLE_ROW_SPACING
                 
-                # Score entries
-                for i, score_data in enumerate(top_scores[:5]):
-                    if i >= 5:
-                        break  # Show only top 5
+                    # Score entries
+                    for i, score_data in enumerate(top_scores[:5]):
+                        if i >= 5:
+                            break  # Show only top 5
                     
-                    date_obj = datetime.strptime(score_data['date'], "%Y-%m-%d %H:%M:%S")
-                    date_str = date_obj.strftime("%Y-%m-%d")
-                    time_str = date_obj.strftime("%H:%M")
-                    player_name = score_data.get('player', 'Unknown')
+                        player_name = score_data.get('player', 'Unknown')
                     
-                    # Highlight current score
-                    row_color = (255, 215, 0) if score_data['score'] == stats['total'] else \
-                              (192, 192, 192) if i == 0 else \
-                              (150, 150, 150)
+                        # Highlight current score
+                        row_color = (255, 215, 0) if score_data['score'] == stats['total'] else \
+                                  (192, 192, 192) if i == 0 else \
+                                  (150, 150, 150)
                     
-                    x = x_start
-                    cells = [f"#{i+1}", f"{score_data['score']}", player_name, date_str, time_str]
-                    for cell, width in zip(cells, col_widths):
-                        draw_text_with_shadow(cell, row_color, (x + width/2, y_pos), "center")
-                        x += width
+                        cells = (f"#{i+1}", f"{score_data['score']}", player_name,
+                                 score_data['date_str'], score_data['time_str'])
+                        for cell, col_x in zip(cells, TABLE_COLUMN_CENTERS):
+                            draw_text_with_shadow(cell, row_color, (col_x, y_pos), "center", end_blits)
                     
-                    y_pos += TABLE_ROW_SPACING
+                        y_pos += TABLE_ROW_SPACING
         
-        if crashed:
-            y_pos = draw_text_with_shadow("CRASHED!", (255, 0, 0), (WIDTH/2, y_pos), "center")
-            y_pos = draw_text_with_shadow("Press R to try again", (200, 200, 200), (WIDTH/2, y_pos), "center")
+            if crashed:
+                y_pos = draw_text_with_shadow("CRASHED!", (255, 0, 0), (WIDTH/2, y_pos), "center", end_blits)
+                y_pos = draw_text_with_shadow("Press R to try again", (200, 200, 200), (WIDTH/2, y_pos), "center", end_blits)
+            _end_screen_key = end_key
+            _end_screen_blits = end_blits
+        DISPLAY.blits(_end_screen_blits, doreturn=0)
     
     # Update display
     pygame.display.flip()
+    end_screen_shown = landed or crashed
+    return True
 
 
 # Text input is handled by TextInputHandler in input_handler.py
 
-def update() -> None:
+def update(keys=None) -> None:
     """Update game state for the current frame.
     
+    Args:
+        keys: Key state snapshot for this frame (polled if not given)
+    
     Handles:
     1. Name input mode (if active)
     2. Game reset via 'R' key
@@ -943,13 +1230,16 @@ def update() -> None:
         # cancel or idle simply return to game
         return
 
+    if keys is None:
+        keys = pygame.key.get_pressed()
+
     # Toggle name input with N key
-    if keyboard.n and not (landed or crashed):
+    if keys[pygame.K_n] and not (landed or crashed):
         # start input and consume the initial 'n' press so it doesn't appear
         text_input.start(current_player_name, consume_keys={'n'})
         return
 
-    if keyboard.r:
+    if keys[pygame.K_r]:
         reset()
         return
 
@@ -957,13 +1247,23 @@ def update() -> None:
         return
 
     dt = get_frame_time()
-    apply_physics(dt)
+    apply_physics(dt, keys)
     check_collision()
 
 
 # Initialize random pad location at start
 reset()
 
+# Background stars (created once, scrolled every frame)
+star_field = create_star_field()
+
+# Bake the lander rotations up front rather than on the first frames
+if lander_sprite is not None:
+    get_rotated_lander(lander_sprite, 0)
+
+# Credits never change, so they are rendered once up front
+credits_surf, credits_pos = render_credits()
+
 def main() -> None:
     """Main entry point for the game. Runs the game loop.
     
@@ -973,10 +1273,7 @@ def main() -> None:
     - Drawing
     - Frame rate control
     """
-    global clock, DISPLAY
-    
-    # Create clock for controlling frame rate
-    clock = pygame.time.Clock()
+    global DISPLAY, end_screen_shown
     
     # Debug info
     print(f"Debug: Window size = {WIDTH}x{HEIGHT}")
@@ -990,6 +1287,9 @@ def main() -> None:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # Window contents were lost; redraw even a static end screen
+                end_screen_shown = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
@@ -999,16 +1299,20 @@ def main() -> None:
                 # Update keyboard state for Pygame Zero compatibility
                 keyboard._release(event.key)
 
+        # Snapshot key state once per frame (after the event queue is drained)
+        keys = pygame.key.get_pressed()
+
         # Run game logic
-        update()
+        update(keys)
         
         # Draw everything
-        draw()
+        presented = draw(keys)
         
-        # Control frame rate
-        clock.tick(TARGET_FPS)
+        # Control frame rate; events are polled right after the wait
+        wait_for_next_frame(presented)
 
-    # Clean up
+    # Clean up (let the music loader finish before tearing down the mixer)
+    sound_loader.join(timeout=2.0)
     pygame.mixer.music.stop()  # Stop background music
     pygame.quit()
 
@@ -7,8 +7,9 @@ corruption.
 import os
 import sys
 import json
+import bisect
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 from constants import DEFAULT_PLAYER_NAME, MAX_TOP_SCORES
 
 
@@ -35,38 +36,66 @@ SETTINGS_FILE = os.path.join(DATA_DIR, 'settings.json')
 
 DEFAULT_SETTINGS = {'save_player': True, 'save_scores': True}
 
+# Score timestamps; 'date_str'/'time_str' hold the display parts so the
+# hall of fame never has to parse them back
+SCORE_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
-def atomic_write_json(path: str, data) -> None:
+
+def atomic_write_json(path: str, data, sync: bool = True) -> None:
+    """Write data as JSON via a temp file and rename.
+
+    With sync=False the fsync is skipped: the rename still keeps readers from
+    ever seeing a half-written file, but the data may not survive a power cut.
+    """
     try:
         tmp = path + '.tmp'
         with open(tmp, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2)
             f.flush()
-            os.fsync(f.fileno())
+            if sync:
+                os.fsync(f.fileno())
         os.replace(tmp, path)
     except Exception:
         with open(path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2)
 
 
+# Last contents known to be on disk, so saving an unchanged value can skip
+# the write (and its fsync) entirely
+_last_saved_settings: Optional[dict] = None
+_last_saved_name: Optional[str] = None
+
+
+def _unchanged_on_disk(path: str, value, last) -> bool:
+    # The exists() check catches the file having been removed behind our back
+    return last is not None and value == last and os.path.exists(path)
+
+
 def load_settings() -> dict:
+    global _last_saved_settings
     try:
-        if os.path.exists(SETTINGS_FILE):
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if not isinstance(data, dict):
-                    return DEFAULT_SETTINGS.copy()
-                s = DEFAULT_SETTINGS.copy()
-                s.update(data)
-                return s
+        # No exists() check first: a missing file just raises into the default below
+        with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+            if not isinstance(data, dict):
+                return DEFAULT_SETTINGS.copy()
+            _last_saved_settings = dict(data)
+            s = DEFAULT_SETTINGS.copy()
+            s.update(data)
+            return s
     except Exception:
         pass
     return DEFAULT_SETTINGS.copy()
 
 
 def save_settings(settings: dict) -> None:
+    global _last_saved_settings
+    if _unchanged_on_disk(SETTINGS_FILE, settings, _last_saved_settings):
+        return
     try:
-        atomic_write_json(SETTINGS_FILE, settings)
+        # Cheap to lose on a power cut, so no fsync
+        atomic_write_json(SETTINGS_FILE, settings, sync=False)
+        _last_saved_settings = dict(settings)
     except Exception:
         pass
 
@@ -78,52 +107,88 @@ SAVE_SCORES = bool(_runtime_settings.get('save_scores', True))
 
 
 def load_player_name() -> str:
+    global _last_saved_name
     try:
-        if os.path.exists(PLAYER_FILE):
-            with open(PLAYER_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return data.get('name', DEFAULT_PLAYER_NAME)
+        with open(PLAYER_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+            if isinstance(data, dict):
+                _last_saved_name = data.get('name')
+                return data.get('name', DEFAULT_PLAYER_NAME)
     except Exception:
         pass
     return DEFAULT_PLAYER_NAME
 
 
 def save_player_name(name: str) -> None:
-    if not SAVE_PLAYER:
+    global _last_saved_name
+    if not SAVE_PLAYER or _unchanged_on_disk(PLAYER_FILE, name, _last_saved_name):
         return
     try:
-        atomic_write_json(PLAYER_FILE, {'name': name})
+        atomic_write_json(PLAYER_FILE, {'name': name}, sync=False)
+        _last_saved_name = name
     except Exception:
         pass
 
 
+def _date_fields(when: datetime) -> Dict:
+    date = when.strftime(SCORE_DATE_FORMAT)
+    return {'date': date, 'date_str': date[:10], 'time_str': date[11:16]}
+
+
+def _add_display_date(entry: Dict) -> Dict:
+    """Fill in 'date_str'/'time_str' on entries saved before they were stored."""
+    if 'date_str' not in entry or 'time_str' not in entry:
+        # SCORE_DATE_FORMAT is fixed width, so slicing is all the parsing needed
+        date = str(entry['date'])
+        entry['date_str'], entry['time_str'] = date[:10], date[11:16]
+    return entry
+
+
+def _rank_key(entry: Dict):
+    # Ascending key for a highest-first score list
+    return -entry['score']
+
+
 def load_scores() -> List[Dict]:
     try:
-        if os.path.exists(SCORES_FILE):
-            with open(SCORES_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, dict) and 'high_score' in data:
-                    return [{'score': data['high_score'], 'player': DEFAULT_PLAYER_NAME,
-                             'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'stats': None}]
-                if isinstance(data, list):
-                    valid = [item for item in data if isinstance(item, dict) and 'score' in item and 'player' in item and 'date' in item]
-                    return valid
+        with open(SCORES_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+            if isinstance(data, dict) and 'high_score' in data:
+                return [{'score': data['high_score'], 'player': DEFAULT_PLAYER_NAME,
+                         **_date_fields(datetime.now()), 'stats': None}]
+            if isinstance(data, list):
+                valid = [_add_display_date(item) for item in data
+                         if isinstance(item, dict) and 'score' in item and 'player' in item and 'date' in item]
+                # Normally already in order; sorted here so inserts can bisect
+                valid.sort(key=_rank_key)
+                return valid
     except Exception:
         pass
     return []
 
 
-def save_new_score(score: int, stats: dict, player: str = DEFAULT_PLAYER_NAME) -> List[Dict]:
+def save_new_score(score: int, stats: dict, player: str = DEFAULT_PLAYER_NAME,
+                   current: Optional[List[Dict]] = None) -> List[Dict]:
+    """Add a score, keep the best MAX_TOP_SCORES and save them.
+
+    current is the caller's already loaded score list; pass it to skip
+    re-reading the scores file. Returns the new list (current is not modified).
+    """
     try:
-        scores = load_scores()
+        scores = list(current) if current is not None else load_scores()
         new_score = {'score': score, 'player': player,
-                     'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'stats': stats}
-        scores.append(new_score)
-        scores.sort(key=lambda x: x['score'], reverse=True)
-        scores = scores[:MAX_TOP_SCORES]
+                     **_date_fields(datetime.now()), 'stats': stats}
+        # The list is kept highest first; insert after any equal scores
+        # (bisect's key= needs Python 3.10, so bisect a list of the keys)
+        pos = bisect.bisect_right([_rank_key(s) for s in scores], _rank_key(new_score))
+        if pos >= MAX_TOP_SCORES:
+            # Didn't make the table, so there is nothing new to write
+            return scores[:MAX_TOP_SCORES]
+        scores.insert(pos, new_score)
+        del scores[MAX_TOP_SCORES:]
         if SAVE_SCORES:
-            atomic_write_json(SCORES_FILE, scores)
+            # Written right after a landing, so don't stall the game on fsync
+            atomic_write_json(SCORES_FILE, scores, sync=False)
         return scores
     except Exception:
         return []
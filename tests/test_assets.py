@@ -0,0 +1,78 @@
+"""Test the image cache in assets.py."""
+import os
+import sys
+import pytest
+import pygame
+
+import assets
+from assets import IMAGE_CACHE_SIZE, _load_cached, load_image, resource_path
+
+
+@pytest.fixture(autouse=True)
+def display():
+    """Open a tiny window (convert_alpha needs one) and start with an empty cache."""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    load_image.cache_clear()
+    yield
+    load_image.cache_clear()
+
+
+def _save_image(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pygame.image.save(pygame.Surface(size), str(path))
+    return str(path)
+
+
+def test_image_cache_is_bounded(tmp_path):
+    """Test that the cache holds at most IMAGE_CACHE_SIZE surfaces and can be cleared."""
+    assert _load_cached.cache_info().maxsize == IMAGE_CACHE_SIZE
+
+    paths = [_save_image(tmp_path / f'img{i}.png', (2, 2)) for i in range(IMAGE_CACHE_SIZE + 3)]
+    for p in paths:
+        load_image(p)
+    assert _load_cached.cache_info().currsize == IMAGE_CACHE_SIZE
+
+    load_image.cache_clear()
+    assert _load_cached.cache_info().currsize == 0
+
+
+def test_replaced_image_is_reloaded(tmp_path):
+    """Test that a file replaced on disk (new mtime) is loaded again."""
+    path = _save_image(tmp_path / 'sprite.png', (2, 2))
+    assert load_image(path).get_size() == (2, 2)
+    assert load_image(path).get_size() == (2, 2)
+    assert _load_cached.cache_info().misses == 1
+
+    _save_image(tmp_path / 'sprite.png', (3, 3))
+    mtime = os.stat(path).st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+    assert load_image(path).get_size() == (3, 3)
+
+
+def test_bundled_images_skip_stat(tmp_path, monkeypatch):
+    """Test that no stat is made for files inside a PyInstaller bundle."""
+    path = _save_image(tmp_path / 'sprite.png', (2, 2))
+    monkeypatch.setattr(sys, '_MEIPASS', str(tmp_path), raising=False)
+
+    def no_stat(*args, **kwargs):
+        raise AssertionError('os.stat called for a bundled asset')
+    monkeypatch.setattr(assets.os, 'stat', no_stat)
+
+    assert assets._asset_mtime(path) is None
+
+
+def test_path_aliases_share_one_cache_entry(tmp_path):
+    """Test that 'a/./b.png' and 'a/b.png' are cached once."""
+    path = _save_image(tmp_path / 'a' / 'b.png', (2, 2))
+    alias = os.path.join(str(tmp_path), 'a', '.', 'b.png')
+    assert load_image(alias) is load_image(path)
+    assert _load_cached.cache_info().currsize == 1
+
+
+def test_resource_path_returns_absolute_paths_unchanged(tmp_path):
+    """Test that absolute paths bypass the bundle/source directory lookup."""
+    path = str(tmp_path / 'sprite.png')
+    assert resource_path(path) == path
+    assert resource_path(os.path.join('assets', 'x.png')) != os.path.join('assets', 'x.png')
@@ -0,0 +1,138 @@
+"""Test the VC runtime DLL search in tools/bundle_vcruntime.py."""
+import os
+import sys
+import site
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+import bundle_vcruntime  # noqa: E402
+from bundle_vcruntime import ALLOWED_BASENAMES, _scan_root, copy_to_dist, find_runtime_dlls  # noqa: E402
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'dll')
+    return str(path)
+
+
+def _use_roots(monkeypatch, cwd, *roots):
+    """Point find_runtime_dlls at the given roots (in order) and cwd."""
+    prefix = roots[0] if roots else str(cwd)
+    monkeypatch.setattr(sys, 'base_prefix', str(prefix))
+    monkeypatch.setattr(sys, 'exec_prefix', str(prefix))
+    monkeypatch.setattr(site, 'getsitepackages', lambda: [str(r) for r in roots[1:]])
+    monkeypatch.setattr(site, 'getusersitepackages', lambda: '')
+    monkeypatch.chdir(cwd)
+
+
+def test_scan_skips_hidden_and_skip_dirs(tmp_path):
+    """Test that hidden, cache and test directories are not searched."""
+    wanted = _touch(tmp_path / 'lib' / 'vcruntime140.dll')
+    _touch(tmp_path / '.hidden' / 'msvcp140.dll')
+    _touch(tmp_path / '__pycache__' / 'concrt140.dll')
+    _touch(tmp_path / 'tests' / 'vccorlib140.dll')
+    _touch(tmp_path / 'lib' / 'msvcp140-1a2b.dll')  # not an allowed name
+
+    found = {}
+    assert not _scan_root(str(tmp_path), found)
+    assert found == {'vcruntime140.dll': wanted}
+
+
+def test_scan_stops_once_all_found_and_first_copy_wins(tmp_path, monkeypatch):
+    """Test the early exit and that the shallowest, then alphabetically first, copy is kept."""
+    for name in ALLOWED_BASENAMES:
+        _touch(tmp_path / 'a' / name)
+        _touch(tmp_path / 'b' / name)
+    _touch(tmp_path / 'a' / 'deeper' / 'msvcp140.dll')
+
+    visited = []
+    real_walk = os.walk
+
+    def counting_walk(top, *args, **kwargs):
+        for entry in real_walk(top, *args, **kwargs):
+            visited.append(os.path.relpath(entry[0], str(tmp_path)))
+            yield entry
+    monkeypatch.setattr(os, 'walk', counting_walk)
+
+    found = {}
+    assert _scan_root(str(tmp_path), found)
+    assert sorted(found) == sorted(ALLOWED_BASENAMES)
+    assert all(os.path.dirname(p) == str(tmp_path / 'a') for p in found.values())
+    # 'b' is never listed once 'a' has supplied every DLL
+    assert visited == ['.', 'a']
+
+
+def test_earlier_root_wins_over_later_roots(tmp_path, monkeypatch):
+    """Test that a DLL in an earlier root is preferred over one in the current directory."""
+    prefix = tmp_path / 'python'
+    project = tmp_path / 'project'
+    wanted = _touch(prefix / 'vcruntime140.dll')
+    _touch(project / 'vcruntime140.dll')
+    extra = _touch(project / 'lib' / 'msvcp140.dll')
+    _use_roots(monkeypatch, project, prefix)
+
+    assert find_runtime_dlls() == sorted([os.path.realpath(wanted), os.path.realpath(extra)])
+
+
+def test_venv_inside_project_is_still_searched(tmp_path, monkeypatch):
+    """Test that a hidden .venv under the current directory is walked as its own root."""
+    project = tmp_path / 'project'
+    venv = project / '.venv'
+    site_packages = venv / 'Lib' / 'site-packages'
+    wanted = _touch(site_packages / 'somepkg' / 'msvcp140.dll')
+    _use_roots(monkeypatch, project, venv, site_packages)
+
+    assert find_runtime_dlls() == [os.path.realpath(wanted)]
+
+
+def _copy_with_spy(monkeypatch, src, dist):
+    """Run copy_to_dist on src, returning (result, list of copy2 destinations)."""
+    copies = []
+    real_copy2 = bundle_vcruntime.shutil.copy2
+
+    def spy(s, d):
+        copies.append(d)
+        return real_copy2(s, d)
+    monkeypatch.setattr(bundle_vcruntime.shutil, 'copy2', spy)
+    return copy_to_dist([src], str(dist)), copies
+
+
+def test_copy_skips_unchanged_destination(tmp_path, monkeypatch):
+    """Test that a destination with the same size and mtime isn't copied again."""
+    src = _touch(tmp_path / 'src' / 'msvcp140.dll')
+    dest = str(tmp_path / 'dist' / 'msvcp140.dll')
+    copy_to_dist([src], str(tmp_path / 'dist'))
+
+    copied, copies = _copy_with_spy(monkeypatch, src, tmp_path / 'dist')
+    assert copied == [dest]
+    assert copies == []
+
+
+def test_copy_overwrites_changed_destination(tmp_path, monkeypatch):
+    """Test that a destination differing in size or mtime is replaced."""
+    src = _touch(tmp_path / 'src' / 'msvcp140.dll')
+    dest = _touch(tmp_path / 'dist' / 'msvcp140.dll')
+    with open(dest, 'wb') as f:
+        f.write(b'older build')
+
+    copied, copies = _copy_with_spy(monkeypatch, src, tmp_path / 'dist')
+    assert copied == copies == [dest]
+    with open(dest, 'rb') as f:
+        assert f.read() == b'dll'
+
+    # Same size but a different mtime is copied too
+    mtime = os.stat(src).st_mtime_ns - 1_000_000_000
+    os.utime(dest, ns=(mtime, mtime))
+    copied, copies = _copy_with_spy(monkeypatch, src, tmp_path / 'dist')
+    assert copies == [dest]
+    assert os.stat(dest).st_mtime_ns == os.stat(src).st_mtime_ns
+
+
+def test_copy_creates_missing_destination(tmp_path, monkeypatch):
+    """Test that a DLL not yet in dist is copied."""
+    src = _touch(tmp_path / 'src' / 'vcruntime140.dll')
+    dest = str(tmp_path / 'dist' / 'vcruntime140.dll')
+
+    copied, copies = _copy_with_spy(monkeypatch, src, tmp_path / 'dist')
+    assert copied == copies == [dest]
+    assert os.path.isfile(dest)
@@ -236,4 +236,87 @@ def test_error_handling(monkeypatch):
     handler.start('test')
     status, name = handler.update(FakeKeyboard())
     assert status == 'idle'  # should not crash
-    assert handler.name == 'test'  # should preserve existing name
\ No newline at end of file
+    assert handler.name == 'test'  # should preserve existing name
+
+
+def test_key_pressed_pygame_fallback(monkeypatch):
+    handler = TextInputHandler()
+
+    class FakePressed:
+        def __init__(self, codes):
+            self.codes = codes
+
+        def __getitem__(self, code):
+            return code in self.codes
+
+    monkeypatch.setattr(pygame.key, 'get_pressed', lambda: FakePressed({pygame.K_a, pygame.K_MINUS}))
+
+    assert handler._key_pressed(FakeKeyboard(), 'a')
+    assert handler._key_pressed(FakeKeyboard(), '-')
+    assert handler._key_pressed(FakeKeyboard(), '_')
+    assert not handler._key_pressed(FakeKeyboard(), 'b')
+    # pgzero keyboard attributes still count when pygame reports nothing
+    assert handler._key_pressed(FakeKeyboard(b=True), 'b')
+
+
+def test_get_pressed_polled_once_per_update(monkeypatch):
+    handler = TextInputHandler()
+    monkeypatch.setattr(pygame.time, 'get_ticks', lambda: 0)
+
+    calls = {'n': 0}
+
+    class Snapshot:
+        def __getitem__(self, code):
+            return code == pygame.K_a
+
+    def fake_get_pressed():
+        calls['n'] += 1
+        return Snapshot()
+
+    monkeypatch.setattr(pygame.key, 'get_pressed', fake_get_pressed)
+
+    handler.start()
+    handler.update(FakeKeyboard())
+    assert handler.name == 'a'
+    assert calls['n'] == 1
+
+
+def test_backspace_hold_waits_for_repeat_delay(monkeypatch):
+    handler = TextInputHandler(repeat_delay=200, repeat_interval=50)
+    t = {'now': 0}
+    monkeypatch.setattr(pygame.time, 'get_ticks', lambda: t['now'])
+
+    pressed = {'backspace'}
+    def _key_pressed(self, keyboard, k):
+        return k in pressed
+    handler._key_pressed = types.MethodType(_key_pressed, handler)
+
+    handler.start('abcd')
+    handler.update(FakeKeyboard())
+    assert handler.name == 'abc'
+
+    # Holding for less than the repeat delay deletes nothing more
+    for now in (16, 33, 100, 150):
+        t['now'] = now
+        handler.update(FakeKeyboard())
+    assert handler.name == 'abc'
+
+    t['now'] = 200
+    handler.update(FakeKeyboard())
+    assert handler.name == 'ab'
+
+
+def test_minus_key_inserts_single_hyphen(monkeypatch):
+    handler = TextInputHandler()
+    monkeypatch.setattr(pygame.time, 'get_ticks', lambda: 0)
+    monkeypatch.setattr(pygame.key, 'get_mods', lambda: 0)
+
+    class Snapshot:
+        def __getitem__(self, code):
+            return code == pygame.K_MINUS
+
+    monkeypatch.setattr(pygame.key, 'get_pressed', lambda: Snapshot())
+
+    handler.start()
+    handler.update(FakeKeyboard())
+    assert handler.name == '-'
@@ -0,0 +1,35 @@
+"""Test frame pacing in main.py."""
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import main  # noqa: E402  (opens the game window at import)
+
+
+def test_end_screen_frame_is_paced_with_vsync(monkeypatch):
+    """Test that a frame which skips flip() still waits when vsync is active."""
+    monkeypatch.setattr(main, 'VSYNC_ACTIVE', True)
+    monkeypatch.setattr(main, 'landed', True)
+    monkeypatch.setattr(main, 'end_screen_shown', True)
+    monkeypatch.setattr(main, '_next_frame', None)
+
+    presented = main.draw()
+    assert presented is False
+
+    start = time.perf_counter()
+    main.wait_for_next_frame(presented)
+    assert time.perf_counter() - start >= 0.9 / main.TARGET_FPS
+
+
+def test_presented_frame_relies_on_vsync(monkeypatch):
+    """Test that a flipped frame isn't paced again when vsync is active."""
+    monkeypatch.setattr(main, 'VSYNC_ACTIVE', True)
+    monkeypatch.setattr(main, '_next_frame', None)
+
+    def no_sleep(seconds):
+        raise AssertionError('limiter ran after a vsync flip')
+    monkeypatch.setattr(main.time, 'sleep', no_sleep)
+
+    main.wait_for_next_frame(True)
@@ -9,7 +9,7 @@ from persistence import (
     save_player_name, load_player_name,
     save_new_score, load_scores,
     DEFAULT_SETTINGS, DEFAULT_PLAYER_NAME, MAX_TOP_SCORES,
-    DATA_DIR
+    DATA_DIR, SCORES_FILE
 )
 
 @pytest.fixture(autouse=True)
@@ -142,4 +142,53 @@ def test_scores_merge_sort(temp_data_dir):
     
     # Verify order
     assert [s['score'] for s in scores] == [1000, 750, 500]
-    assert [s['player'] for s in scores] == ["Player 1", "Player 3", "Player 2"]
\ No newline at end of file
+    assert [s['player'] for s in scores] == ["Player 1", "Player 3", "Player 2"]
+
+def test_scores_store_display_date(temp_data_dir):
+    """Test that display date/time are stored and filled in for old entries."""
+    scores = save_new_score(500, None, "Player")
+    assert scores[0]['date_str'] == scores[0]['date'][:10]
+    assert scores[0]['time_str'] == scores[0]['date'][11:16]
+
+    # Entries written before date_str/time_str existed get them on load
+    with open(SCORES_FILE, 'w', encoding='utf-8') as f:
+        json.dump([{'score': 100, 'player': "Old", 'date': "2024-03-05 07:08:09"}], f)
+    loaded = load_scores()
+    assert loaded[0]['date_str'] == "2024-03-05"
+    assert loaded[0]['time_str'] == "07:08"
+
+def test_scores_save_with_current_list(temp_data_dir):
+    """Test that passing the in-memory list skips re-reading the file."""
+    scores = save_new_score(300, None, "Player 1")
+    # Changes on disk are not picked up when the current list is passed in
+    os.unlink(SCORES_FILE)
+    scores = save_new_score(400, None, "Player 2", scores)
+    assert [s['score'] for s in scores] == [400, 300]
+    assert load_scores() == scores
+
+def test_scores_insert_keeps_order(temp_data_dir):
+    """Test that a new score goes after equal scores and unsorted files are ordered on load."""
+    with open(SCORES_FILE, 'w', encoding='utf-8') as f:
+        json.dump([{'score': 100, 'player': "Low", 'date': "2024-01-01 00:00:00"},
+                   {'score': 300, 'player': "High", 'date': "2024-01-01 00:00:00"}], f)
+    assert [s['player'] for s in load_scores()] == ["High", "Low"]
+
+    scores = save_new_score(100, None, "New")
+    assert [s['player'] for s in scores] == ["High", "Low", "New"]
+
+def test_unchanged_saves_skip_write(temp_data_dir, monkeypatch):
+    """Test that re-saving an unchanged name or an off-table score doesn't write."""
+    import persistence
+    save_player_name("Same")
+    full = [save_new_score(1000, None, f"Player {i}") for i in range(MAX_TOP_SCORES)][-1]
+
+    writes = []
+    monkeypatch.setattr(persistence, 'atomic_write_json', lambda path, *a, **k: writes.append(path))
+    save_player_name("Same")
+    assert save_new_score(10, None, "Low", full) == full
+    assert writes == []
+
+    # A missing file is written again even if the name matches
+    os.unlink(persistence.PLAYER_FILE)
+    save_player_name("Same")
+    assert writes == [persistence.PLAYER_FILE]
@@ -12,34 +12,100 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import glob
 import os
 import shutil
 import site
 import sys
-from typing import List, Set
+from typing import Dict, List
 
 
-RUNTIME_PATTERNS = [
-    "**/vcruntime*.dll",
-    "**/msvcp*.dll",
-    "**/concrt140.dll",
-    "**/vccorlib140.dll",
-]
-
 # Curated list of allowed runtime DLL basenames. This avoids copying
 # hashed/artifact-named variants like 'msvcp140-<hash>.dll'. Only files
 # with these exact basenames will be copied.
-ALLOWED_BASENAMES = {
+ALLOWED_BASENAMES = frozenset({
     "vcruntime140.dll",
     "vcruntime140_1.dll",
     "msvcp140.dll",
     "concrt140.dll",
     "vccorlib140.dll",
-}
+})
+
+
+# Directory names never worth descending into (compared lowercased). Hidden
+# directories are skipped too, as the recursive globs used to do.
+SKIP_DIRS = frozenset({
+    "__pycache__",
+    "node_modules",
+    "pip",
+    "test",
+    "tests",
+})
+
+
+def _scan_root(root: str, found: Dict[str, str]) -> bool:
+    """Record files under root whose basename is in ALLOWED_BASENAMES.
+
+    found maps each lowercased basename to the first path seen for it; later
+    copies of the same DLL are ignored. The walk is top-down with directories
+    in sorted order, so shallower copies win and the result is repeatable.
+    One os.walk per root: each directory is listed once and os.walk already
+    separates files from directories, so no per-file stat is needed.
+    Returns True (and stops walking) once all allowed DLLs are found.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames
+                             if not d.startswith(".") and d.lower() not in SKIP_DIRS)
+        for name in sorted(filenames):
+            b = name.lower()
+            if b in ALLOWED_BASENAMES and b not in found:
+                # Roots are already absolute (see _unique_roots)
+                found[b] = os.path.join(dirpath, name)
+        if len(found) == len(ALLOWED_BASENAMES):
+            return True
+    return False
+
+
+def _walk_reaches(parent: str, child: str) -> bool:
+    """Return True if walking parent would descend into child.
+
+    Both are normcase'd realpaths. The walk prunes hidden and SKIP_DIRS
+    directories, so e.g. a project-local .venv is not reached from the
+    project directory and has to stay a root of its own.
+    """
+    prefix = parent.rstrip(os.sep) + os.sep
+    if not child.startswith(prefix):
+        return False
+    parts = child[len(prefix):].split(os.sep)
+    return not any(d.startswith(".") or d.lower() in SKIP_DIRS for d in parts)
+
+
+def _unique_roots(roots: List[str]) -> List[str]:
+    """Resolve roots, dropping missing ones and those another walk covers.
+
+    In a venv base_prefix and exec_prefix are usually the same directory and
+    site-packages lives under it, so without this one tree is walked 2-3 times.
+    Order is preserved.
+    """
+    resolved: List[str] = []
+    keys: List[str] = []  # normcase'd copies, for comparing on Windows
+    for r in roots:
+        if r and os.path.isdir(r):
+            real = os.path.realpath(r)
+            key = os.path.normcase(real)
+            if key not in keys:
+                resolved.append(real)
+                keys.append(key)
+    return [real for real, key in zip(resolved, keys)
+            if not any(_walk_reaches(k, key) for k in keys if k != key)]
 
 
 def find_runtime_dlls() -> List[str]:
+    """Return one path per allowed DLL name found on this system.
+
+    Roots are searched in order: the Python installation, site-packages, the
+    user site-packages, then the current directory. Where a DLL exists in
+    several places the first copy found is used (see _scan_root).
+    """
     roots: List[str] = []
     # Python installation roots
     roots.append(sys.base_prefix)
@@ -57,28 +123,24 @@ def find_runtime_dlls() -> List[str]:
     except Exception:
         pass
 
-    found: Set[str] = set()
-    for root in roots:
-        if not root or not os.path.isdir(root):
-            continue
-        for pattern in RUNTIME_PATTERNS:
-            path_pattern = os.path.join(root, pattern)
-            for p in glob.glob(path_pattern, recursive=True):
-                if os.path.isfile(p):
-                    # Only include candidates whose basename is in the allowed set
-                    b = os.path.basename(p).lower()
-                    if b in ALLOWED_BASENAMES:
-                        found.add(os.path.abspath(p))
-
     # Also check current directory as a last resort
-    for pattern in RUNTIME_PATTERNS:
-        for p in glob.glob(os.path.join(os.getcwd(), pattern), recursive=True):
-            if os.path.isfile(p):
-                b = os.path.basename(p).lower()
-                if b in ALLOWED_BASENAMES:
-                    found.add(os.path.abspath(p))
+    roots.append(os.getcwd())
+
+    found: Dict[str, str] = {}
+    for root in _unique_roots(roots):
+        if _scan_root(root, found):
+            break
 
-    return sorted(found)
+    return sorted(found.values())
+
+
+def _same_file_stat(src: str, dest: str) -> bool:
+    """Return True if dest exists with the same size and mtime as src."""
+    try:
+        ss, ds = os.stat(src), os.stat(dest)
+    except OSError:
+        return False
+    return ss.st_size == ds.st_size and ss.st_mtime_ns == ds.st_mtime_ns
 
 
 def copy_to_dist(dll_paths: List[str], dist_dir: str) -> List[str]:
@@ -88,7 +150,9 @@ def copy_to_dist(dll_paths: List[str], dist_dir: str) -> List[str]:
         name = os.path.basename(src)
         dest = os.path.join(dist_dir, name)
         try:
-            shutil.copy2(src, dest)
+            # copy2 keeps mtimes, so a re-run finds identical files already there
+            if not _same_file_stat(src, dest):
+                shutil.copy2(src, dest)
             copied.append(dest)
         except Exception:
             # Ignore copy errors for safety